@@ -6,6 +6,7 @@ from components.drivetrain import Drivetrain
 class Boomerang(AutonomousStateMachine):
     MODE_NAME = "Boomerang"
     DEFAULT = True
+    END_POSE = (0, 0, 360)
 
     drivetrain = Drivetrain
 
@@ -5,6 +5,7 @@ from components.drivetrain import Drivetrain
 
 class Forward(AutonomousStateMachine):
     MODE_NAME = "Forward"
+    END_POSE = (10, 0, 0)
 
     drivetrain = Drivetrain
 
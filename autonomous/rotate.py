@@ -5,6 +5,7 @@ from components.drivetrain import Drivetrain
 
 class Rotate(AutonomousStateMachine):
     MODE_NAME = "Rotate"
+    END_POSE = (0, 0, 360)
 
     drivetrain = Drivetrain
 
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""Score every autonomous mode by running it in the simulator
+
+Each mode runs in its own process against the physics in physics.py,
+ with pyfrc's fake time so results don't depend on the machine's load
+ (except for the CPU time). The scoreboard shows how long each mode
+ and each of its states took, how far from its `END_POSE` it stopped,
+ the largest outputs it commanded from the Drivetrain, and the CPU time
+ robot code used per loop.
+
+Results are saved by git revision, so a change can be compared with
+ the scores from an earlier commit:
+    python3 -m common.autonomous_scoreboard --compare <revision>
+
+A mode's `END_POSE` is where it should stop relative to where it
+ started, as `(feet forward, feet right, degrees clockwise)`.
+"""
+import argparse
+import glob
+import importlib
+import inspect
+import json
+import logging
+import math
+import multiprocessing
+import os
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+
+from common.text_table import print_table
+
+# Time to stay disabled before autonomous. Robots sit disabled before a
+#  match, so modes start from the state disabled loops leave behind
+DISABLED_TIME = 1.0
+# Longest time to wait for the robot to stop after a mode finishes,
+#  before measuring where it ended up
+SETTLE_TIME = 1.0
+# Speed in meters or radians per second below which the robot is stopped
+STOPPED_SPEED = 0.01
+# Scores shown as changes from the compared revision
+COMPARED = ['time', 'position_error', 'heading_error', 'cpu_per_loop']
+
+
+def find_modes(package: str = 'autonomous') -> Dict[str, type]:
+    """Autonomous mode classes by mode name, found the same way as
+     magicbot's AutonomousModeSelector"""
+    from magicbot import AutonomousStateMachine
+
+    module_path = os.path.dirname(
+        importlib.import_module(package).__file__)
+    modes = {}
+    for file_name in sorted(glob.glob(os.path.join(module_path, '*.py'))):
+        module_name = os.path.basename(file_name)[:-3]
+        if module_name == '__init__':
+            continue
+        module = importlib.import_module('.' + module_name, package)
+        for _, mode in inspect.getmembers(module, inspect.isclass):
+            if (issubclass(mode, AutonomousStateMachine) and
+                    hasattr(mode, 'MODE_NAME') and
+                    not getattr(mode, 'DISABLED', False)):
+                modes[mode.MODE_NAME] = mode
+    return modes
+
+
+def relative_pose(start: Tuple[float, float, float],
+                  end: Tuple[float, float, float]
+                  ) -> Tuple[float, float, float]:
+    """`end` relative to `start`, both from the sim's `get_position()`,
+     as `(feet forward, feet right, degrees clockwise)`"""
+    start_x, start_y, start_angle = start
+    x, y, angle = end
+    cos = math.cos(start_angle)
+    sin = math.sin(start_angle)
+    return ((x - start_x) * cos + (y - start_y) * sin,
+            -(x - start_x) * sin + (y - start_y) * cos,
+            math.degrees(angle - start_angle))
+
+
+def heading_difference(first: float, second: float) -> float:
+    """Smallest difference between two headings in degrees"""
+    return abs((first - second + 180) % 360 - 180)
+
+
+class ScoreKeeper:
+    """Runs one autonomous mode, recording its score on each driver
+     station packet
+
+    Robot code runs one loop between packets, so the CPU time between
+     packets, less the time spent here and in the physics, is the robot
+     code's time for that loop.
+    """
+
+    def __init__(self, control, robot, physics, mode_name: str,
+                 time_limit: float):
+        self.control = control
+        self.robot = robot
+        self.physics = physics
+        self.mode_name = mode_name
+        self.time_limit = time_limit
+
+        self.start_time = None
+        self.start_pose = None
+        self.end_time = None
+        self.end_pose = None
+        self.mode = None
+        self.started = False
+
+        self.states = []
+        self.state_start = None
+        self.peak_forward = 0.0
+        self.peak_rotation = 0.0
+        self.loop_times = []
+        self.last_step_end = None
+
+    def on_step(self, tm: float) -> bool:
+        step_start = time.process_time()
+        if (self.last_step_end is not None and self.started and
+                self.end_time is None):
+            self.loop_times.append(step_start - self.last_step_end)
+
+        self.physics._set_robot_enabled(
+            self.control.get_mode() != 'disabled')
+        self.physics._on_increment_time(tm)
+
+        if self.start_time is None:
+            if tm >= DISABLED_TIME:
+                import wpilib
+                wpilib.SmartDashboard.putString('Auto Selector',
+                                                self.mode_name)
+                self.control.set_autonomous()
+                self.start_time = tm
+                self.start_pose = self.physics.get_position()
+                self.mode = self.robot._automodes.modes[self.mode_name]
+        elif self.end_time is None:
+            self._sample(tm)
+        elif self._settled(tm):
+            self.end_pose = self.physics.get_position()
+
+        self.last_step_end = time.process_time()
+        # Keep running until the mode finishes and the robot stops, or
+        #  the mode runs out of time
+        if self.start_time is None:
+            return True
+        if tm - self.start_time >= self.time_limit:
+            self.end_pose = self.end_pose or self.physics.get_position()
+        return self.end_pose is None
+
+    def _sample(self, tm: float):
+        drivetrain = self.robot.drivetrain
+        self.peak_forward = max(self.peak_forward,
+                                abs(drivetrain.last_forward_speed))
+        self.peak_rotation = max(self.peak_rotation,
+                                 abs(drivetrain.last_rotation))
+
+        if self.mode.is_executing:
+            self.started = True
+            state = self.mode.current_state
+            if not self.states or self.states[-1][0] != state:
+                self._end_state(tm)
+                self.states.append([state, 0.0])
+                self.state_start = tm
+        elif self.started:
+            self._end_state(tm)
+            self.end_time = tm
+
+    def _settled(self, tm: float) -> bool:
+        engine = self.physics.engine
+        return (tm - self.end_time >= SETTLE_TIME or
+                (abs(engine.speed) < STOPPED_SPEED and
+                 abs(engine.rotation_speed) < STOPPED_SPEED))
+
+    def _end_state(self, tm: float):
+        if self.states:
+            self.states[-1][1] = tm - self.state_start
+
+    def result(self, end_pose: Optional[Tuple[float, float, float]]
+               ) -> Dict[str, object]:
+        finished = self.end_time is not None
+        if not finished:
+            self._end_state(self.start_time + self.time_limit)
+        pose = relative_pose(self.start_pose, self.end_pose)
+        position_error = heading_error = None
+        if end_pose is not None:
+            position_error = math.hypot(pose[0] - end_pose[0],
+                                        pose[1] - end_pose[1])
+            heading_error = heading_difference(pose[2], end_pose[2])
+        loop_times = self.loop_times or [0.0]
+        return dict(
+            mode=self.mode_name,
+            finished=finished,
+            time=(self.end_time if finished else
+                  self.start_time + self.time_limit) - self.start_time,
+            states=self.states,
+            pose=pose,
+            position_error=position_error,
+            heading_error=heading_error,
+            peak_forward=self.peak_forward,
+            peak_rotation=self.peak_rotation,
+            cpu_per_loop=sum(loop_times) / len(loop_times),
+            max_cpu_per_loop=max(loop_times),
+            collisions=self.physics.engine.collisions)
+
+
+def run_mode(mode_name: str, end_pose, time_limit: float,
+             config_file: str) -> Dict[str, object]:
+    """Run one autonomous mode in the simulator, in a worker process"""
+    logging.basicConfig(level=logging.WARNING)
+    # The robot imports wpilib, which has to be imported before pyfrc's
+    #  physics imports the HAL's data
+    import robot
+    from pyfrc.physics.core import PhysicsInterface
+    from pyfrc.test_support.pytest_plugin import PyFrcPlugin
+
+    with open(config_file) as config:
+        config_obj = json.load(config)
+    robot_file = os.path.abspath(robot.__file__)
+    plugin = PyFrcPlugin(robot.Robot, robot_file,
+                         os.path.dirname(robot_file))
+
+    # The same setup as pyfrc's test fixtures, plus the physics, which
+    #  pyfrc only runs in the interactive simulator
+    plugin.pytest_runtest_setup()
+    try:
+        control = plugin._test_controller
+        physics = PhysicsInterface(os.path.dirname(robot_file),
+                                   plugin._fake_time, config_obj)
+        score_keeper = ScoreKeeper(control, control._robot, physics,
+                                   mode_name, time_limit)
+        control.run_test(score_keeper.on_step)
+        return score_keeper.result(end_pose)
+    finally:
+        plugin.pytest_runtest_teardown(None)
+
+
+def revision() -> str:
+    """Name of the checked out git revision, marked if it has changes"""
+    try:
+        return subprocess.check_output(
+            ['git', 'describe', '--always', '--dirty'],
+            universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def load_results(output: str, name: str) -> List[Dict[str, object]]:
+    """Saved results for a revision, by file name or git revision"""
+    file_name = os.path.join(output, name + '.json')
+    if not os.path.exists(file_name):
+        resolved = subprocess.check_output(
+            ['git', 'describe', '--always', name],
+            universal_newlines=True).strip()
+        file_name = os.path.join(output, resolved + '.json')
+    with open(file_name) as results_file:
+        return json.load(results_file)['modes']
+
+
+def table_row(result: Dict[str, object], default: bool,
+              previous: Optional[Dict[str, object]]) -> Dict[str, object]:
+    """Scoreboard row for a mode, with the changes from `previous`"""
+    def error(name):
+        # Modes without an END_POSE have no errors
+        return '-' if result[name] is None else result[name]
+
+    row = dict(
+        mode=result['mode'] + (' *' if default else ''),
+        finished=result['finished'],
+        time=result['time'],
+        position_error=error('position_error'),
+        heading_error=error('heading_error'),
+        peak_forward=result['peak_forward'],
+        peak_rotation=result['peak_rotation'],
+        cpu_per_loop=result['cpu_per_loop'] * 1000,
+        max_cpu_per_loop=result['max_cpu_per_loop'] * 1000,
+        collisions=result['collisions'])
+    if previous is not None:
+        for name in COMPARED:
+            new, old = result[name], previous[name]
+            if name.startswith('cpu'):
+                new, old = new * 1000, old * 1000
+            row[name + '_change'] = (
+                '{:+.3g}'.format(new - old)
+                if new is not None and old is not None else '-')
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('modes', nargs='*',
+                        help='Modes to run, all of them by default')
+    parser.add_argument('--compare', metavar='REVISION',
+                        help='Show changes from the results saved for a '
+                        'git revision')
+    parser.add_argument('--output', default='scoreboard',
+                        help='Directory the results are saved in')
+    parser.add_argument('--config', default=os.path.join('sim',
+                                                         'config.json'))
+    parser.add_argument('--time-limit', type=float, default=15.0,
+                        help='Seconds a mode can run before it is stopped')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of modes to run in parallel')
+    args = parser.parse_args(argv)
+
+    modes = find_modes()
+    names = args.modes or sorted(modes)
+    for name in names:
+        if name not in modes:
+            parser.error('Unknown mode {!r}, modes are: {}'.format(
+                name, ', '.join(sorted(modes))))
+    previous = {}
+    if args.compare:
+        previous = {result['mode']: result
+                    for result in load_results(args.output, args.compare)}
+
+    # wpilib keeps global state, so every mode gets a new process
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(args.jobs, maxtasksperchild=1) as pool:
+        results = pool.starmap(run_mode, [
+            (name, getattr(modes[name], 'END_POSE', None),
+             args.time_limit, args.config) for name in names])
+
+    os.makedirs(args.output, exist_ok=True)
+    name = revision()
+    # Keep the saved results of modes that weren't run this time
+    saved = {}
+    if os.path.exists(os.path.join(args.output, name + '.json')):
+        saved = {result['mode']: result
+                 for result in load_results(args.output, name)}
+    saved.update((result['mode'], result) for result in results)
+    with open(os.path.join(args.output, name + '.json'), 'w') as output:
+        json.dump({'revision': name,
+                   'modes': [saved[mode] for mode in sorted(saved)]},
+                  output, indent=2)
+
+    print_table([table_row(result,
+                           getattr(modes[result['mode']], 'DEFAULT', False),
+                           previous.get(result['mode']))
+                 for result in results])
+    print()
+    for result in results:
+        print('{}: {}'.format(result['mode'], '  '.join(
+            '{} {:.2f}s'.format(state, seconds)
+            for state, seconds in result['states'])))
+    print()
+    print('* default mode. Errors are in feet and degrees, CPU time in ms')
+    print('Saved results for {} in {}'.format(name, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Measure where the time goes while the robot code boots"""
+
+import builtins
+import importlib
+import importlib.util
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class BootProfiler:
+    """Records import time per module and creation time per device
+
+    Import times are exclusive: time spent importing a module's own
+     dependencies is counted against those dependencies, not the module.
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.import_times = {}
+        self.device_times = OrderedDict()
+        self.section_times = OrderedDict()
+        self._original_import = None
+        self._original_import_module = None
+        # Time spent in nested imports, for each import in progress
+        self._child_times = []
+
+    def install(self):
+        """Start timing imports, call before the imports to measure"""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        # Modules loaded by name, like autonomous modes, don't go
+        #  through __import__
+        self._original_import_module = importlib.import_module
+        importlib.import_module = self._timed_import_module
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+        self._original_import = None
+        self._original_import_module = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(),
+                      level=0):
+        if level != 0:
+            return self._original_import(name, globals, locals, fromlist,
+                                         level)
+
+        # Only the first import of a module does any work
+        if name not in sys.modules:
+            self._time(name, self._original_import, name, globals, locals,
+                       (), level)
+        if fromlist:
+            self._time_submodules(name, fromlist)
+        return self._original_import(name, globals, locals, fromlist, level)
+
+    def _time_submodules(self, name, fromlist):
+        # `from package import submodule` loads the submodule without
+        #  going through __import__, so time it separately
+        module = sys.modules.get(name)
+        if not hasattr(module, '__path__'):
+            return
+        for item in fromlist:
+            submodule = name + '.' + item
+            if (item == '*' or hasattr(module, item) or
+                    submodule in sys.modules):
+                continue
+            try:
+                self._time(submodule, self._original_import, submodule)
+            except ModuleNotFoundError as error:
+                # Not a submodule, the original import reports a missing
+                #  name
+                if error.name != submodule:
+                    raise
+                self.import_times.pop(submodule, None)
+
+    def _timed_import_module(self, name, package=None):
+        absolute_name = importlib.util.resolve_name(name, package)
+        if absolute_name in sys.modules:
+            return self._original_import_module(name, package)
+        return self._time(absolute_name, self._original_import_module,
+                          name, package)
+
+    def _time(self, name, import_function, *args):
+        self._child_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            return import_function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            child_time = self._child_times.pop()
+            self.import_times[name] = elapsed - child_time
+            if self._child_times:
+                self._child_times[-1] += elapsed
+
+    def create(self, factory, *args, **kwargs):
+        """Create a device with `factory(*args, **kwargs)`, timing it"""
+        start = time.perf_counter()
+        device = factory(*args, **kwargs)
+        # Name devices by their port numbers, other arguments like
+        #  motor controllers are named by their type
+        arguments = ', '.join(
+            repr(arg) if isinstance(arg, (int, float, str))
+            else type(arg).__name__ for arg in args)
+        name = '%s(%s)' % (getattr(factory, '__name__', factory), arguments)
+        self.device_times[name] = time.perf_counter() - start
+        return device
+
+    @contextmanager
+    def section(self, name):
+        """Time a block of code"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.section_times[name] = time.perf_counter() - start
+
+    def finish(self):
+        """Mark the robot code as ready"""
+        self.uninstall()
+        self.end_time = time.perf_counter()
+
+    @property
+    def total_time(self) -> float:
+        """Seconds from creating the profiler to robot code ready"""
+        end_time = self.end_time or time.perf_counter()
+        return end_time - self.start_time
+
+    def report(self, count=15) -> str:
+        """Human readable report of the `count` slowest imports, and
+         all devices and sections"""
+        lines = ['Robot code ready in %.3fs' % self.total_time]
+
+        lines.append('Imports: %.3fs total' % sum(self.import_times.values()))
+        slowest = sorted(self.import_times.items(),
+                         key=lambda item: item[1], reverse=True)
+        for name, elapsed in slowest[:count]:
+            lines.append('  %8.1fms  %s' % (elapsed * 1000, name))
+
+        lines.append('Devices: %.3fs total' % sum(self.device_times.values()))
+        for name, elapsed in self.device_times.items():
+            lines.append('  %8.1fms  %s' % (elapsed * 1000, name))
+
+        for name, elapsed in self.section_times.items():
+            lines.append('%s: %.3fs' % (name, elapsed))
+        return '\n'.join(lines)
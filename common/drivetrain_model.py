@@ -0,0 +1,154 @@
+"""Physical model of the drivetrain's motors, battery and traction"""
+
+import math
+from typing import NamedTuple
+
+# Acceleration due to gravity in meters per second squared
+GRAVITY = 9.81
+
+
+class DCMotor(NamedTuple):
+    """Brushed DC motor, described by its datasheet values"""
+    # Torque in newton meters and current in amps at stall
+    stall_torque: float
+    stall_current: float
+    # Speed in radians per second and current in amps with no load
+    free_speed: float
+    free_current: float
+    # Voltage the datasheet values were measured at
+    nominal_voltage: float
+
+    @property
+    def resistance(self) -> float:
+        """Winding resistance in ohms"""
+        return self.nominal_voltage / self.stall_current
+
+    @property
+    def kv(self) -> float:
+        """Speed constant in radians per second per volt of back-EMF"""
+        return self.free_speed / (
+            self.nominal_voltage - self.resistance * self.free_current)
+
+    @property
+    def kt(self) -> float:
+        """Torque constant in newton meters per amp"""
+        return self.stall_torque / self.stall_current
+
+
+# CIM motor, 5310 RPM free speed
+CIM = DCMotor(stall_torque=2.42, stall_current=133, free_speed=556.0,
+              free_current=2.7, nominal_voltage=12)
+
+
+class Battery(NamedTuple):
+    """Robot battery, including the resistance of the main wiring"""
+    voltage: float = 12.5
+    resistance: float = 0.02
+    # Lowest voltage to allow before the roboRIO browns out
+    min_voltage: float = 7.0
+
+
+class DrivetrainModel(NamedTuple):
+    """Skid steer drivetrain with the same gearbox on each side
+
+    All values are in SI units, speeds in meters or radians per second.
+    """
+    motor: DCMotor = CIM
+    battery: Battery = Battery()
+    motors_per_side: int = 2
+    gear_ratio: float = 10.71
+    wheel_radius: float = 0.48 / (2 * math.pi)
+    # Distance between the left and right wheels
+    track_width: float = 0.6
+    mass: float = 40.0
+    # Radius of gyration of the robot about its center, for rotation
+    gyration_radius: float = 0.35
+    # Current limit per motor in amps, matching the 40A breakers
+    current_limit: float = 40.0
+    traction_coefficient: float = 1.0
+    # Fraction of traction left for turning, as the wheels
+    #  scrub sideways during a turn
+    turning_traction: float = 0.6
+
+    @property
+    def motor_count(self) -> int:
+        return 2 * self.motors_per_side
+
+    def motor_current(self, wheel_speed: float, braking: bool) -> float:
+        """Current drawn by each motor at full output, with the wheels
+         moving at `wheel_speed`, accounting for voltage sag and the
+         current limit
+
+        When `braking`, the motors are driven against their direction of
+         travel, so back-EMF adds to the applied voltage.
+        """
+        motor_speed = wheel_speed * self.gear_ratio / self.wheel_radius
+        back_emf = motor_speed / self.motor.kv
+        if braking:
+            back_emf = -back_emf
+        # The battery's voltage sags by the total current drawn
+        #  times its resistance
+        current = (self.battery.voltage - back_emf) / (
+            self.motor.resistance + self.motor_count * self.battery.resistance)
+        sag_limit = (self.battery.voltage - self.battery.min_voltage) / (
+            self.motor_count * self.battery.resistance)
+        return max(0.0, min(current, self.current_limit, sag_limit))
+
+    def wheel_force(self, wheel_speed: float, braking: bool = False) -> float:
+        """Total force in newtons the wheels can apply to the ground,
+         ignoring traction"""
+        current = self.motor_current(abs(wheel_speed), braking)
+        torque = self.motor.kt * max(0.0, current - self.motor.free_current)
+        return (self.motor_count * torque * self.gear_ratio /
+                self.wheel_radius)
+
+    def max_acceleration(self, speed: float, braking: bool = False) -> float:
+        """Maximum linear acceleration in meters per second squared
+         while driving straight at `speed`"""
+        traction = self.traction_coefficient * self.mass * GRAVITY
+        return min(self.wheel_force(speed, braking), traction) / self.mass
+
+    def max_angular_acceleration(self, angular_speed: float,
+                                 braking: bool = False) -> float:
+        """Maximum angular acceleration in radians per second squared
+         while turning in place at `angular_speed`"""
+        lever_arm = self.track_width / 2
+        wheel_speed = angular_speed * lever_arm
+        traction = (self.traction_coefficient * self.turning_traction *
+                    self.mass * GRAVITY)
+        force = min(self.wheel_force(wheel_speed, braking), traction)
+        inertia = self.mass * self.gyration_radius ** 2
+        return force * lever_arm / inertia
+
+    @property
+    def free_speed(self) -> float:
+        """Top linear speed in meters per second, with no load other
+         than the motors' own friction"""
+        resistance = (self.motor.resistance +
+                      self.motor_count * self.battery.resistance)
+        voltage = self.battery.voltage - self.motor.free_current * resistance
+        motor_speed = voltage * self.motor.kv
+        return motor_speed * self.wheel_radius / self.gear_ratio
+
+    @property
+    def free_angular_speed(self) -> float:
+        """Top angular speed in radians per second, turning in place"""
+        return self.free_speed / (self.track_width / 2)
+
+    @property
+    def acceleration_output(self) -> float:
+        """Fraction of full output needed per meter per second squared of
+         linear acceleration, in addition to the output for the speed,
+         ignoring the current limit"""
+        resistance = (self.motor.resistance +
+                      self.motor_count * self.battery.resistance)
+        force_per_volt = (self.motor_count * self.motor.kt * self.gear_ratio /
+                          (self.wheel_radius * resistance))
+        return self.mass / (force_per_volt * self.battery.voltage)
+
+    @property
+    def angular_acceleration_output(self) -> float:
+        """Fraction of full output needed per radian per second squared
+         of angular acceleration, turning in place"""
+        return (self.acceleration_output * self.gyration_radius ** 2 /
+                (self.track_width / 2))
@@ -0,0 +1,63 @@
+"""PID coefficients scheduled by motion profile phase and move size"""
+
+import math
+from typing import List, NamedTuple, Tuple
+
+from common.pid import PIDCoefficients
+
+
+class PhaseGains(NamedTuple):
+    """PID coefficients for each phase of a motion profile
+
+    Fields are in the order of the `Phase` values in motion_profiles.py,
+     so `gains[phase.value]` gives a phase's coefficients.
+    """
+    acceleration: PIDCoefficients
+    cruise: PIDCoefficients
+    deceleration: PIDCoefficients
+
+
+def interpolate(low: PhaseGains, high: PhaseGains,
+                fraction: float) -> PhaseGains:
+    """Linearly interpolate every coefficient between `low` and `high`"""
+    return PhaseGains(*(
+        PIDCoefficients(*(
+            low_coef + (high_coef - low_coef) * fraction
+            for low_coef, high_coef in zip(low_coefs, high_coefs)))
+        for low_coefs, high_coefs in zip(low, high)))
+
+
+class GainSchedule:
+    """Precomputed table of `PhaseGains`, indexed by target magnitude"""
+
+    def __init__(self, breakpoints: List[Tuple[float, PhaseGains]],
+                 max_magnitude: float, resolution: float):
+        """Interpolate between `breakpoints`, a list of target magnitudes
+         and the gains tuned for them, for every multiple of `resolution`
+         up to `max_magnitude`
+
+        Magnitudes outside of the breakpoints use the closest breakpoint's
+         gains.
+        """
+        breakpoints = sorted(breakpoints, key=lambda point: point[0])
+        self.resolution = resolution
+        count = int(math.ceil(max_magnitude / resolution))
+        self.entries = [self._interpolate(breakpoints, index * resolution)
+                        for index in range(count + 1)]
+
+    @staticmethod
+    def _interpolate(breakpoints, magnitude):
+        if magnitude <= breakpoints[0][0]:
+            return breakpoints[0][1]
+        for (low_magnitude, low), (high_magnitude, high) in zip(
+                breakpoints, breakpoints[1:]):
+            if magnitude <= high_magnitude:
+                fraction = ((magnitude - low_magnitude) /
+                            (high_magnitude - low_magnitude))
+                return interpolate(low, high, fraction)
+        return breakpoints[-1][1]
+
+    def lookup(self, magnitude: float) -> PhaseGains:
+        """Gains for a move of `magnitude`, in constant time"""
+        index = int(round(abs(magnitude) / self.resolution))
+        return self.entries[min(index, len(self.entries) - 1)]
@@ -0,0 +1,164 @@
+"""Shape driver inputs, and measure how long they take to reach the motors"""
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+import wpilib
+
+from utils import clamp
+
+
+class Deadband:
+    """Ignore small inputs from a joystick that doesn't center exactly"""
+
+    def __init__(self, width: float):
+        """Inputs within `width` of zero are zero, the rest of the range
+         is rescaled so the output still starts at zero"""
+        self.width = width
+
+    def __call__(self, value: float) -> float:
+        magnitude = abs(value)
+        if magnitude <= self.width:
+            return 0.0
+        return math.copysign((magnitude - self.width) / (1 - self.width),
+                             value)
+
+
+class ExpoCurve:
+    """Give finer control near the center of the stick, keeping
+     full output at full stick"""
+
+    def __init__(self, exponent: float, resolution: int = 256):
+        """Output is `|input| ** exponent` with the input's sign, read
+         from a table of `resolution` linearly interpolated steps"""
+        self.resolution = resolution
+        self.table = [(index / resolution) ** exponent
+                      for index in range(resolution + 1)]
+
+    def __call__(self, value: float) -> float:
+        position = min(abs(value), 1.0) * self.resolution
+        index = min(int(position), self.resolution - 1)
+        fraction = position - index
+        low = self.table[index]
+        output = low + (self.table[index + 1] - low) * fraction
+        return math.copysign(output, value)
+
+
+class SlewRateLimiter:
+    """Limit how quickly the output can change, to avoid tipping
+     or slipping the wheels on sudden stick movements"""
+
+    def __init__(self, rate: float, period: float = 0.02):
+        """`rate` is the largest change in output per second, `period`
+         the expected time between calls, used for the first call"""
+        self.rate = rate
+        self.period = period
+        self.output = 0.0
+        self.last_time = None
+        self.clock = wpilib.Timer.getFPGATimestamp
+
+    def __call__(self, value: float) -> float:
+        now = self.clock()
+        elapsed = self.period if self.last_time is None else \
+            now - self.last_time
+        self.last_time = now
+        max_step = self.rate * elapsed
+        self.output += clamp(value - self.output, max_step, -max_step)
+        return self.output
+
+
+class InputPipeline:
+    """Chain of shaping stages applied to one input axis"""
+
+    def __init__(self, *stages: Callable[[float], float]):
+        self.stages = stages
+
+    def __call__(self, value: float) -> float:
+        for stage in self.stages:
+            value = stage(value)
+        return value
+
+
+class Statistic:
+    """Latest, smoothed average and maximum of a measurement"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget every measurement"""
+        self.last = 0.0
+        self.average = 0.0
+        self.max = 0.0
+        self.count = 0
+
+    def add(self, value: float):
+        self.last = value
+        self.max = max(self.max, value)
+        self.count += 1
+        # Plain average until there are enough samples to smooth over
+        weight = max(1 / self.count, 0.05)
+        self.average += weight * (value - self.average)
+
+
+class LatencyMonitor:
+    """Measures each cycle's time from reading the driver's inputs to
+     sending the motor outputs
+
+    Times are wall clock, not match time, so they reflect the time
+     actually spent in robot code and on the CAN bus. Measurements are
+     split up to show where the time goes:
+
+    `loop_period`: time between cycles' input reads
+    `shaping_time`: reading and shaping the inputs
+    `write_time`: sending the motor outputs
+    `latency`: input read to outputs sent, including running every
+     component before the outputs are written
+
+    Measurements, including each maximum, are since the last `reset`.
+     Reset when teleop is enabled, so time spent disabled isn't counted
+     as a loop period, and the maxima cover only the current enable.
+    """
+
+    def __init__(self):
+        self.loop_period = Statistic()
+        self.shaping_time = Statistic()
+        self.write_time = Statistic()
+        self.latency = Statistic()
+        self.clock = time.perf_counter
+        self.reset()
+
+    def reset(self):
+        """Start measuring again, forgetting the last input read"""
+        for statistic in (self.loop_period, self.shaping_time,
+                          self.write_time, self.latency):
+            statistic.reset()
+        self.input_time = None
+        self.last_input_time = None
+
+    def mark_input(self):
+        """Call right before reading the driver's inputs"""
+        now = self.clock()
+        if self.last_input_time is not None:
+            self.loop_period.add(now - self.last_input_time)
+        self.input_time = self.last_input_time = now
+
+    def mark_shaped(self):
+        """Call once the inputs have been read and shaped"""
+        if self.input_time is not None:
+            self.shaping_time.add(self.clock() - self.input_time)
+
+    @contextmanager
+    def output(self):
+        """Wrap sending the motor outputs for the inputs"""
+        start = self.clock()
+        yield
+        end = self.clock()
+        self.write_time.add(end - start)
+        # Only count the first output after each input, autonomous
+        #  doesn't read inputs at all
+        if self.input_time is not None:
+            self.latency.add(end - self.input_time)
+            self.input_time = None
@@ -1,11 +1,22 @@
 """Provide motion profiles for smooth and efficient motion"""
 
+import enum
 import math
-from typing import Callable
+from typing import Callable, Union
 
 import wpilib
 
+from common.gain_schedule import GainSchedule
 from common.pid import PIDCoefficients, PIDController
+from utils import clamp
+
+
+class Phase(enum.Enum):
+    """Phases of a motion profile, times after the end of the
+     profile are part of the deceleration phase"""
+    acceleration = 0
+    cruise = 1
+    deceleration = 2
 
 
 class MotionProfile:
@@ -86,6 +97,14 @@ class MotionProfile:
             # Time at which the motion profile should be completed
             self.end_time = self.acceleration_end_time + deceleration_time
 
+    def phase(self, time) -> Phase:
+        """Get the phase of the profile at a specific time"""
+        if time < self.acceleration_end_time:
+            return Phase.acceleration
+        if time < self.deceleration_start_time:
+            return Phase.cruise
+        return Phase.deceleration
+
     # position() can be used for times after the end of the profile,
     #  this is so that if the PID hasn't got the robot to the
     #  target position by the end it can keep reducing the position
@@ -126,43 +145,103 @@ class MotionProfile:
         # Handle reverse (negative) directions
         return position if not self.reverse else -position
 
+    def velocity(self, time):
+        """Get the optimal velocity at a specific time"""
+        if time <= 0 or time >= self.end_time:
+            velocity = 0.0
+        elif time < self.acceleration_end_time:
+            velocity = self.acceleration * time
+        elif time < self.deceleration_start_time:
+            velocity = self.max_speed
+        else:
+            velocity = self.max_speed + self.deceleration * (
+                time - self.deceleration_start_time)
+        return velocity if not self.reverse else -velocity
+
+    def acceleration_at(self, time):
+        """Get the optimal acceleration at a specific time"""
+        if time <= 0 or time >= self.end_time:
+            acceleration = 0.0
+        else:
+            acceleration = [self.acceleration, 0.0,
+                            self.deceleration][self.phase(time).value]
+        return acceleration if not self.reverse else -acceleration
+
 
 class ProfileExecutor:
     def __init__(
-            self, pid_coefs: PIDCoefficients, motion_profile: MotionProfile,
+            self, pid_coefs: Union[PIDCoefficients, GainSchedule],
+            motion_profile: MotionProfile,
             input_source: Callable[[], float], output: Callable[[float], None],
-            acceptable_error_margin: float):
+            acceptable_error_margin: float,
+            feedforward: Callable[[float, float], float] = None):
         """Wrapper for a PID controller and a motion profile. Ties
          them together for seemless profile execution
 
         Uses `input_source` to retrieve current input for motion profile,
          and `output` to write PID output. `acceptable_error_margin` is the
          acceptable amount of error as a decimal.
+
+        `pid_coefs` can be a `GainSchedule`, to switch coefficients with
+         the profile's phase, using the gains for the profile's distance.
+
+        `feedforward(velocity, acceleration)` optionally gives the output
+         needed to follow the profile, it's added to the PID output so
+         the PID only has to correct errors.
+
+        The profile is complete once it has ended and the input is within
+         the error margin of the target.
         """
 
+        # Gains for each phase, looked up once since the
+        #  profile's distance doesn't change
+        self.phase_gains = None
+        if isinstance(pid_coefs, GainSchedule):
+            final_position = motion_profile.position(motion_profile.end_time)
+            self.phase_gains = pid_coefs.lookup(final_position)
+            pid_coefs = self.phase_gains.acceleration
+
         self.pid = PIDController(pid_coefs, 1.0, -1.0)
         self.profile_start_time = wpilib.Timer.getFPGATimestamp()
         self.motion_profile = motion_profile
         self.input_source = input_source
         self.output = output
         self.acceptable_error_margin = acceptable_error_margin
+        self.feedforward = feedforward
+        # Most recent goal, input and output, for telemetry
+        self.goal = 0.0
+        self.input = 0.0
+        self.last_output = 0.0
 
     def update(self) -> bool:
         """Updates motion profile and writes output. Returns `True`
-         if profile is completed (robot is within error margin of
-         target), otherwise `False`.
+         if profile is completed (profile has ended and robot is within
+         error margin of target), otherwise `False`.
         """
         time_delta = wpilib.Timer.getFPGATimestamp() - self.profile_start_time
 
         current_goal_position = self.motion_profile.position(time_delta)
 
+        if self.phase_gains is not None:
+            phase = self.motion_profile.phase(time_delta)
+            self.pid.set_coefs(self.phase_gains[phase.value])
+
         current_input = self.input_source()
 
         output = self.pid.get_output(current_input, current_goal_position)
+        if self.feedforward is not None:
+            output = clamp(output + self.feedforward(
+                self.motion_profile.velocity(time_delta),
+                self.motion_profile.acceleration_at(time_delta)), 1.0, -1.0)
         self.output(output)
+
+        self.goal = current_goal_position
+        self.input = current_input
+        self.last_output = output
         final_position = self.motion_profile.position(
             self.motion_profile.end_time)
 
         error = abs(final_position - current_input) / \
             abs(final_position)
-        return error < self.acceptable_error_margin
+        return (time_delta >= self.motion_profile.end_time and
+                error < self.acceptable_error_margin)
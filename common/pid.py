@@ -99,10 +99,23 @@ class PIDController:
         self._previous_input = current_input
         self._previous_time = current_time
 
-        output = ((self._coefs.p * current_error) + self._integral_term +
+        # The derivative of the input opposes its change, which damps
+        #  the response
+        output = ((self._coefs.p * current_error) + self._integral_term -
                   (self._coefs.d * derivative))
         return clamp(output, self._output_max, self._output_min)
 
+    def set_coefs(self, pid_coefs: PIDCoefficients):
+        """Change the control coefficients
+
+        Only the integral term carries over without a jump, since it is
+        accumulated with the integral coefficient already applied.
+        Changing p or d steps the next output by the change in the
+        proportional and derivative terms: the change in p times the
+        error, and the change in d times the derivative.
+        """
+        self._coefs = pid_coefs
+
     def reset(self):
         """Reset internal control variables
 
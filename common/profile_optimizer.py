@@ -0,0 +1,190 @@
+"""Find the fastest feasible motion profile parameters for a move
+
+The tables the Drivetrain uses are generated ahead of time into
+ common/profile_tables.py, so the robot only has to load them. Run this
+ from the repository root after changing the model or the optimizer:
+    python3 -m common.profile_optimizer
+"""
+
+import argparse
+import math
+from typing import Callable, List, NamedTuple, Sequence, Tuple
+
+from common.drivetrain_model import DrivetrainModel
+
+
+class ProfileParameters(NamedTuple):
+    """Arguments for `MotionProfile`, other than the target distance"""
+    acceleration_time: float
+    deceleration_time: float
+    max_speed: float
+
+    def limit_speed(self, max_speed: float) -> 'ProfileParameters':
+        """Cap the cruise speed at `max_speed`, keeping the same
+         acceleration and deceleration"""
+        if max_speed >= self.max_speed:
+            return self
+        scale = max_speed / self.max_speed
+        return ProfileParameters(self.acceleration_time * scale,
+                                 self.deceleration_time * scale, max_speed)
+
+
+def profile_time(acceleration: float, deceleration: float, max_speed: float,
+                 distance: float) -> float:
+    """Time a trapezoidal or triangular profile takes to travel `distance`"""
+    ramp_distance = (max_speed ** 2 / (2 * acceleration) +
+                     max_speed ** 2 / (2 * deceleration))
+    if distance >= ramp_distance:
+        return (max_speed / acceleration + max_speed / deceleration +
+                (distance - ramp_distance) / max_speed)
+    # Triangular profile, the peak speed is never reached
+    peak_speed = math.sqrt(2 * distance * acceleration * deceleration /
+                           (acceleration + deceleration))
+    return peak_speed / acceleration + peak_speed / deceleration
+
+
+# Fraction of the top speed and acceleration profiles are planned with,
+#  the rest is left for the PID to correct errors on top of the
+#  Drivetrain's feedforward. In the autonomous scoreboard, driving 10
+#  feet at 0.7 peaks at 0.90 arcadeDrive input and turning 360 degrees
+#  at 0.85, stopping 0.08 feet and 1.3 degrees off. At 0.9 they peak at
+#  0.94 and 0.91, and stop 0.12 feet and 2.1 degrees off.
+MARGIN = 0.7
+
+
+def profile_candidates(max_acceleration: Callable[[float, bool], float],
+                       free_speed: float, margin: float = MARGIN,
+                       steps: int = 100) -> List[Tuple[float, float, float]]:
+    """Feasible `(max_speed, acceleration, deceleration)` combinations,
+     for cruise speeds in `steps` increments up to the top speed
+
+    `max_acceleration(speed, braking)` gives the greatest acceleration
+     available at `speed`. It has to decrease with speed while
+     accelerating, as it does for a DC motor, since the profile
+     accelerates at a constant rate up to its cruise speed.
+    `free_speed` is the top speed, and `margin` is the fraction of the
+     available acceleration and speed the profile may use, leaving the
+     rest for the PID to correct errors.
+    """
+    candidates = []
+    for step in range(1, steps + 1):
+        speed = free_speed * margin * step / steps
+        acceleration = margin * max_acceleration(speed, False)
+        # Braking is weakest at low speed, where back-EMF helps least
+        deceleration = margin * min(max_acceleration(speed, True),
+                                    max_acceleration(0.0, True))
+        if acceleration <= 0 or deceleration <= 0:
+            break
+        candidates.append((speed, acceleration, deceleration))
+    return candidates
+
+
+def best_profile(candidates: List[Tuple[float, float, float]],
+                 distance: float) -> ProfileParameters:
+    """The candidate from `profile_candidates` that travels `distance`
+     in the least time"""
+    distance = abs(distance)
+    best = None
+    best_time = math.inf
+    for speed, acceleration, deceleration in candidates:
+        time = profile_time(acceleration, deceleration, speed, distance)
+        if time < best_time:
+            best_time = time
+            best = ProfileParameters(speed / acceleration,
+                                     speed / deceleration, speed)
+    return best
+
+
+def forward_candidates(model: DrivetrainModel, margin: float = MARGIN):
+    """Profile candidates for driving straight, in meters"""
+    return profile_candidates(model.max_acceleration, model.free_speed,
+                              margin)
+
+
+def rotate_candidates(model: DrivetrainModel, margin: float = MARGIN):
+    """Profile candidates for turning in place, in radians"""
+    return profile_candidates(model.max_angular_acceleration,
+                              model.free_angular_speed, margin)
+
+
+class ProfileTable:
+    """Precomputed optimal profile parameters, indexed by distance"""
+
+    def __init__(self, entries: Sequence[Tuple[float, float, float]],
+                 resolution: float):
+        """`entries` are the parameters for each multiple of `resolution`,
+         as built by `build`"""
+        self.resolution = resolution
+        self.entries = [ProfileParameters(*entry) for entry in entries]
+
+    @classmethod
+    def build(cls, candidates: List[Tuple[float, float, float]],
+              max_distance: float, resolution: float) -> 'ProfileTable':
+        """Find the best of `candidates` for every multiple of
+         `resolution` up to `max_distance`
+        """
+        count = int(math.ceil(max_distance / resolution))
+        # Entry zero would be a zero length move, use the smallest
+        #  step's parameters for it instead
+        return cls([best_profile(candidates, max(index, 1) * resolution)
+                    for index in range(count + 1)], resolution)
+
+    def lookup(self, distance: float) -> ProfileParameters:
+        """Parameters for a move of `distance`, in constant time
+
+        Rounds up to the next entry, as a profile optimized for a longer
+         move is still feasible for a shorter one. Distances beyond the
+         table use the last entry.
+        """
+        index = int(math.ceil(abs(distance) / self.resolution))
+        return self.entries[min(index, len(self.entries) - 1)]
+
+
+# The robot's drivetrain
+ROBOT_MODEL = DrivetrainModel(wheel_radius=0.48 / (2 * math.pi))
+# Tables in common/profile_tables.py: up to 10 meters in 5cm steps,
+#  and two turns in half degree steps
+TABLES = {
+    'FORWARD': (forward_candidates, 10.0, 0.05),
+    'ROTATE': (rotate_candidates, 4 * math.pi, math.pi / 360),
+}
+
+
+def build_tables(model: DrivetrainModel = ROBOT_MODEL
+                 ) -> List[Tuple[str, ProfileTable]]:
+    """Build every table in `TABLES` for `model`"""
+    return [(name, ProfileTable.build(candidates(model), max_distance,
+                                      resolution))
+            for name, (candidates, max_distance, resolution)
+            in sorted(TABLES.items())]
+
+
+def write_tables(file_name: str):
+    """Write the tables as a Python module"""
+    with open(file_name, 'w') as tables_file:
+        tables_file.write(
+            '"""Fastest feasible motion profile parameters, as '
+            '`(acceleration_time,\n'
+            ' deceleration_time, max_speed)` for each multiple of the '
+            'resolution\n\n'
+            'Generated by `python3 -m common.profile_optimizer`, '
+            'don\'t edit\n"""\n')
+        for name, table in build_tables():
+            tables_file.write('\n{}_RESOLUTION = {!r}\n{} = (\n'.format(
+                name, table.resolution, name))
+            for entry in table.entries:
+                tables_file.write('    {!r},\n'.format(tuple(entry)))
+            tables_file.write(')\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Generate the Drivetrain\'s motion profile tables')
+    parser.add_argument('--output', default='common/profile_tables.py')
+    args = parser.parse_args(argv)
+    write_tables(args.output)
+    print('Wrote {}'.format(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1655 @@
+"""Fastest feasible motion profile parameters, as `(acceleration_time,
+ deceleration_time, max_speed)` for each multiple of the resolution
+
+Generated by `python3 -m common.profile_optimizer`, don't edit
+"""
+
+FORWARD_RESOLUTION = 0.05
+FORWARD = (
+    (0.08964620199382774, 0.08964620199382774, 0.5970773454963304),
+    (0.08964620199382774, 0.08964620199382774, 0.5970773454963304),
+    (0.12379713608671451, 0.12379713608671451, 0.8245353818758849),
+    (0.15367920341799043, 0.15367920341799043, 1.023561163707995),
+    (0.17502353722604466, 0.17502353722604466, 1.1657224364452166),
+    (0.1963678710340989, 0.1963678710340989, 1.3078837091824382),
+    (0.21344333808054228, 0.21344333808054228, 1.4216127273722154),
+    (0.23051880512698567, 0.23051880512698567, 1.5353417455619927),
+    (0.24759427217342903, 0.24759427217342903, 1.6490707637517699),
+    (0.2604008724582616, 0.2604008724582616, 1.7343675273941028),
+    (0.27747633950470496, 0.27747633950470496, 1.8480965455838803),
+    (0.28601407302792664, 0.28601407302792664, 1.9049610546787688),
+    (0.28601407302792664, 0.28601407302792664, 1.9049610546787688),
+    (0.28601407302792664, 0.28601407302792664, 1.9049610546787688),
+    (0.2921347696377435, 0.29028293978953745, 1.9333933092262128),
+    (0.2921347696377435, 0.29028293978953745, 1.9333933092262128),
+    (0.2921347696377435, 0.29028293978953745, 1.9333933092262128),
+    (0.3004444399539838, 0.2945518065511483, 1.9618255637736572),
+    (0.30898221886714056, 0.2988206733127592, 1.9902578183211017),
+    (0.3177576297977607, 0.30308954007437, 2.0186900728685457),
+    (0.32678073377884215, 0.30735840683598087, 2.04712232741599),
+    (0.33606216793525107, 0.31162727359759174, 2.0755545819634347),
+    (0.34561318731611973, 0.31589614035920255, 2.1039868365108787),
+    (0.355445710426109, 0.3201650071208134, 2.132419091058323),
+    (0.36557236884280736, 0.3244338738824243, 2.1608513456057676),
+    (0.37600656135458965, 0.3287027406440351, 2.1892836001532117),
+    (0.3867625131068236, 0.33297160740564596, 2.217715854700656),
+    (0.3978553403054359, 0.3372404741672568, 2.2461481092481),
+    (0.3978553403054359, 0.3372404741672568, 2.2461481092481),
+    (0.40930112109673156, 0.34150934092886764, 2.2745803637955446),
+    (0.4211169733223878, 0.3457782076904785, 2.303012618342989),
+    (0.4211169733223878, 0.3457782076904785, 2.303012618342989),
+    (0.4333211399404363, 0.3500470744520893, 2.331444872890433),
+    (0.44593308300873025, 0.3543159412137002, 2.3598771274378776),
+    (0.44593308300873025, 0.3543159412137002, 2.3598771274378776),
+    (0.4589735872492474, 0.35858480797531095, 2.3883093819853216),
+    (0.4589735872492474, 0.35858480797531095, 2.3883093819853216),
+    (0.4724648743523999, 0.3628536747369218, 2.416741636532766),
+    (0.48643072934360315, 0.3671225414985327, 2.4451738910802105),
+    (0.48643072934360315, 0.3671225414985327, 2.4451738910802105),
+    (0.5008966405237493, 0.3713914082601435, 2.4736061456276546),
+    (0.5008966405237493, 0.3713914082601435, 2.4736061456276546),
+    (0.5158899547156719, 0.37566027502175436, 2.502038400175099),
+    (0.5158899547156719, 0.37566027502175436, 2.502038400175099),
+    (0.5158899547156719, 0.37566027502175436, 2.502038400175099),
+    (0.5314400498059684, 0.37992914178336523, 2.5304706547225435),
+    (0.5314400498059684, 0.37992914178336523, 2.5304706547225435),
+    (0.5475785268726542, 0.38419800854497604, 2.5589029092699875),
+    (0.5475785268726542, 0.38419800854497604, 2.5589029092699875),
+    (0.5643394245424631, 0.3884668753065869, 2.587335163817432),
+    (0.5643394245424631, 0.3884668753065869, 2.587335163817432),
+    (0.5643394245424631, 0.3884668753065869, 2.587335163817432),
+    (0.5817594586374895, 0.3927357420681978, 2.6157674183648765),
+    (0.5817594586374895, 0.3927357420681978, 2.6157674183648765),
+    (0.5817594586374895, 0.3927357420681978, 2.6157674183648765),
+    (0.5998782906618284, 0.3970046088298086, 2.6441996729123205),
+    (0.5998782906618284, 0.3970046088298086, 2.6441996729123205),
+    (0.5998782906618284, 0.3970046088298086, 2.6441996729123205),
+    (0.6187388292602639, 0.40127347559141946, 2.672631927459765),
+    (0.6187388292602639, 0.40127347559141946, 2.672631927459765),
+    (0.6187388292602639, 0.40127347559141946, 2.672631927459765),
+    (0.6383875694717678, 0.4055423423530303, 2.7010641820072094),
+    (0.6383875694717678, 0.4055423423530303, 2.7010641820072094),
+    (0.6383875694717678, 0.4055423423530303, 2.7010641820072094),
+    (0.6383875694717678, 0.4055423423530303, 2.7010641820072094),
+    (0.6588749754240069, 0.40981120911464114, 2.7294964365546535),
+    (0.6588749754240069, 0.40981120911464114, 2.7294964365546535),
+    (0.6588749754240069, 0.40981120911464114, 2.7294964365546535),
+    (0.6802559131000196, 0.414080075876252, 2.757928691102098),
+    (0.6802559131000196, 0.414080075876252, 2.757928691102098),
+    (0.6802559131000196, 0.414080075876252, 2.757928691102098),
+    (0.6802559131000196, 0.414080075876252, 2.757928691102098),
+    (0.7025901409908865, 0.4183489426378629, 2.7863609456495424),
+    (0.7025901409908865, 0.4183489426378629, 2.7863609456495424),
+    (0.7025901409908865, 0.4183489426378629, 2.7863609456495424),
+    (0.7025901409908865, 0.4183489426378629, 2.7863609456495424),
+    (0.7025901409908865, 0.4183489426378629, 2.7863609456495424),
+    (0.7259428678735188, 0.4226178093994737, 2.8147932001969864),
+    (0.7259428678735188, 0.4226178093994737, 2.8147932001969864),
+    (0.7259428678735188, 0.4226178093994737, 2.8147932001969864),
+    (0.7259428678735188, 0.4226178093994737, 2.8147932001969864),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+    (0.7503853886773415, 0.42688667616108456, 2.843225454744431),
+)
+
+ROTATE_RESOLUTION = 0.008726646259971648
+ROTATE = (
+    (0.03757046510214637, 0.03757046510214637, 0.3790967272992575),
+    (0.03757046510214637, 0.03757046510214637, 0.3790967272992575),
+    (0.046963081377682965, 0.046963081377682965, 0.4738709091240718),
+    (0.05635569765321956, 0.05635569765321956, 0.5686450909488862),
+    (0.06574831392875614, 0.06574831392875614, 0.6634192727737005),
+    (0.07514093020429274, 0.07514093020429274, 0.758193454598515),
+    (0.07514093020429274, 0.07514093020429274, 0.758193454598515),
+    (0.08453354647982934, 0.08453354647982934, 0.8529676364233293),
+    (0.08453354647982934, 0.08453354647982934, 0.8529676364233293),
+    (0.09392616275536593, 0.09392616275536593, 0.9477418182481436),
+    (0.09392616275536593, 0.09392616275536593, 0.9477418182481436),
+    (0.1033187790309025, 0.1033187790309025, 1.0425160000729579),
+    (0.1033187790309025, 0.1033187790309025, 1.0425160000729579),
+    (0.11271139530643912, 0.11271139530643912, 1.1372901818977723),
+    (0.11271139530643912, 0.11271139530643912, 1.1372901818977723),
+    (0.12210401158197572, 0.12210401158197572, 1.2320643637225868),
+    (0.12210401158197572, 0.12210401158197572, 1.2320643637225868),
+    (0.12210401158197572, 0.12210401158197572, 1.2320643637225868),
+    (0.1314966278575123, 0.1314966278575123, 1.326838545547401),
+    (0.1314966278575123, 0.1314966278575123, 1.326838545547401),
+    (0.1408892441330489, 0.1408892441330489, 1.4216127273722154),
+    (0.1408892441330489, 0.1408892441330489, 1.4216127273722154),
+    (0.1408892441330489, 0.1408892441330489, 1.4216127273722154),
+    (0.1502818604085855, 0.1502818604085855, 1.51638690919703),
+    (0.1502818604085855, 0.1502818604085855, 1.51638690919703),
+    (0.1502818604085855, 0.1502818604085855, 1.51638690919703),
+    (0.1502818604085855, 0.1502818604085855, 1.51638690919703),
+    (0.1596744766841221, 0.1596744766841221, 1.6111610910218443),
+    (0.1596744766841221, 0.1596744766841221, 1.6111610910218443),
+    (0.1596744766841221, 0.1596744766841221, 1.6111610910218443),
+    (0.1690670929596587, 0.1690670929596587, 1.7059352728466586),
+    (0.1690670929596587, 0.1690670929596587, 1.7059352728466586),
+    (0.1690670929596587, 0.1690670929596587, 1.7059352728466586),
+    (0.1690670929596587, 0.1690670929596587, 1.7059352728466586),
+    (0.17845970923519525, 0.17845970923519525, 1.8007094546714728),
+    (0.17845970923519525, 0.17845970923519525, 1.8007094546714728),
+    (0.17845970923519525, 0.17845970923519525, 1.8007094546714728),
+    (0.18785232551073186, 0.18785232551073186, 1.8954836364962873),
+    (0.18785232551073186, 0.18785232551073186, 1.8954836364962873),
+    (0.18785232551073186, 0.18785232551073186, 1.8954836364962873),
+    (0.18785232551073186, 0.18785232551073186, 1.8954836364962873),
+    (0.19724494178626845, 0.19724494178626845, 1.9902578183211017),
+    (0.19724494178626845, 0.19724494178626845, 1.9902578183211017),
+    (0.19724494178626845, 0.19724494178626845, 1.9902578183211017),
+    (0.19724494178626845, 0.19724494178626845, 1.9902578183211017),
+    (0.206637558061805, 0.206637558061805, 2.0850320001459157),
+    (0.206637558061805, 0.206637558061805, 2.0850320001459157),
+    (0.206637558061805, 0.206637558061805, 2.0850320001459157),
+    (0.206637558061805, 0.206637558061805, 2.0850320001459157),
+    (0.206637558061805, 0.206637558061805, 2.0850320001459157),
+    (0.21603017433734162, 0.21603017433734162, 2.17980618197073),
+    (0.21603017433734162, 0.21603017433734162, 2.17980618197073),
+    (0.21603017433734162, 0.21603017433734162, 2.17980618197073),
+    (0.21603017433734162, 0.21603017433734162, 2.17980618197073),
+    (0.22542279061287823, 0.22542279061287823, 2.2745803637955446),
+    (0.22542279061287823, 0.22542279061287823, 2.2745803637955446),
+    (0.22542279061287823, 0.22542279061287823, 2.2745803637955446),
+    (0.22542279061287823, 0.22542279061287823, 2.2745803637955446),
+    (0.22542279061287823, 0.22542279061287823, 2.2745803637955446),
+    (0.23481540688841482, 0.23481540688841482, 2.369354545620359),
+    (0.23481540688841482, 0.23481540688841482, 2.369354545620359),
+    (0.23481540688841482, 0.23481540688841482, 2.369354545620359),
+    (0.23481540688841482, 0.23481540688841482, 2.369354545620359),
+    (0.23481540688841482, 0.23481540688841482, 2.369354545620359),
+    (0.24420802316395143, 0.24420802316395143, 2.4641287274451735),
+    (0.24420802316395143, 0.24420802316395143, 2.4641287274451735),
+    (0.24420802316395143, 0.24420802316395143, 2.4641287274451735),
+    (0.24420802316395143, 0.24420802316395143, 2.4641287274451735),
+    (0.24420802316395143, 0.24420802316395143, 2.4641287274451735),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.25360063943948796, 0.25360063943948796, 2.5589029092699875),
+    (0.2629932557150246, 0.2629932557150246, 2.653677091094802),
+    (0.2629932557150246, 0.2629932557150246, 2.653677091094802),
+    (0.2629932557150246, 0.2629932557150246, 2.653677091094802),
+    (0.2629932557150246, 0.2629932557150246, 2.653677091094802),
+    (0.2629932557150246, 0.2629932557150246, 2.653677091094802),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2723858719905612, 0.2723858719905612, 2.7484512729196164),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.2817784882660978, 0.2817784882660978, 2.843225454744431),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.29117110454163436, 0.29117110454163436, 2.9379996365692453),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.300563720817171, 0.300563720817171, 3.03277381839406),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.30995633709270753, 0.30995633709270753, 3.127548000218874),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.3193489533682442, 0.3193489533682442, 3.2223221820436887),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.32874156964378076, 0.32874156964378076, 3.3170963638685027),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.3381341859193174, 0.3381341859193174, 3.411870545693317),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.34752680219485393, 0.34752680219485393, 3.5066447275181316),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.3569194184703905, 0.3569194184703905, 3.6014189093429456),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.36631203474592716, 0.36631203474592716, 3.6961930911677605),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3757046510214637, 0.3757046510214637, 3.7909672729925745),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3850972672970003, 0.3850972672970003, 3.8857414548173885),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.3944898835725369, 0.3944898835725369, 3.9805156366422034),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.40388249984807345, 0.40388249984807345, 4.075289818467017),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.41327511612361, 0.41327511612361, 4.170064000291831),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.4226677323991467, 0.4226677323991467, 4.264838182116646),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.43206034867468324, 0.43206034867468324, 4.35961236394146),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.4414529649502199, 0.4414529649502199, 4.454386545766275),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.45084558122575646, 0.45084558122575646, 4.549160727591089),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.460238197501293, 0.460238197501293, 4.643934909415903),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.46963081377682964, 0.46963081377682964, 4.738709091240718),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.4790234300523662, 0.4790234300523662, 4.833483273065532),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.48841604632790286, 0.48841604632790286, 4.928257454890347),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.4978086626034394, 0.4978086626034394, 5.023031636715161),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5072012788789759, 0.5072012788789759, 5.117805818539975),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5165938951545126, 0.5165938951545126, 5.21258000036479),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5259865114300492, 0.5259865114300492, 5.307354182189604),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5353791277055858, 0.5353791277055858, 5.402128364014419),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.5447717439811224, 0.5447717439811224, 5.496902545839233),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.554164360256659, 0.554164360256659, 5.591676727664048),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5635569765321956, 0.5635569765321956, 5.686450909488862),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5729495928077322, 0.5729495928077322, 5.781225091313676),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5823422090832687, 0.5823422090832687, 5.875999273138491),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.5917348253588053, 0.5917348253588053, 5.970773454963305),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.601127441634342, 0.601127441634342, 6.06554763678812),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6105200579098785, 0.6105200579098785, 6.160321818612934),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6199126741854151, 0.6199126741854151, 6.255096000437748),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6293052904609517, 0.6293052904609517, 6.3498701822625625),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.6386979067364884, 0.6386979067364884, 6.444644364087377),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.648090523012025, 0.648090523012025, 6.539418545912191),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6574831392875615, 0.6574831392875615, 6.634192727737005),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6668757555630981, 0.6668757555630981, 6.728966909561819),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6762683718386348, 0.6762683718386348, 6.823741091386634),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6856609881141713, 0.6856609881141713, 6.918515273211449),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.6950536043897079, 0.6950536043897079, 7.013289455036263),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.7044462206652444, 0.7044462206652444, 7.108063636861077),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.713838836940781, 0.713838836940781, 7.202837818685891),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7232314532163175, 0.7232314532163175, 7.297612000510705),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7326240694918543, 0.7326240694918543, 7.392386182335521),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7420166857673909, 0.7420166857673909, 7.487160364160335),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.7514093020429274, 0.7514093020429274, 7.581934545985149),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.760801918318464, 0.760801918318464, 7.676708727809963),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7701945345940006, 0.7701945345940006, 7.771482909634777),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7795871508695372, 0.7795871508695372, 7.866257091459593),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7889797671450738, 0.7889797671450738, 7.961031273284407),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.7983723834206103, 0.7983723834206103, 8.05580545510922),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8077649996961469, 0.8077649996961469, 8.150579636934035),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.8171576159716835, 0.8171576159716835, 8.245353818758849),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.82655023224722, 0.82655023224722, 8.340128000583663),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8359428485227568, 0.8359428485227568, 8.434902182408479),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8453354647982934, 0.8453354647982934, 8.529676364233293),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8547280810738299, 0.8547280810738299, 8.624450546058107),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.8641206973493665, 0.8641206973493665, 8.71922472788292),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.873513313624903, 0.873513313624903, 8.813998909707735),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8829059299004398, 0.8829059299004398, 8.90877309153255),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.8922985461759764, 0.8922985461759764, 9.003547273357364),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+    (0.9016911624515129, 0.9016911624515129, 9.098321455182178),
+)
@@ -2,53 +2,248 @@
 """Render MotionProfiles using matplotlib
 
 This is useful for testing to see the big picture
- view of the MotionProfile
+ view of the MotionProfile. Profiles are given as a grid of
+ parameter values, or a CSV file with one profile per row, and
+ rendered in parallel. Plots whose inputs haven't changed since
+ the last run are skipped.
+
+Run from the repository root:
+    python3 -m common.render_motion_profiles --distance 2,5,-3
 """
-import errno
+import argparse
+import concurrent.futures
+import csv
+import hashlib
+import itertools
+import json
 import os
+import sys
+from typing import Dict, List, NamedTuple, Tuple
+
+from common.motion_profiles import MotionProfile
+from common.text_table import print_table
+
+PARAMETER_NAMES = ['acceleration_time', 'deceleration_time', 'max_speed',
+                   'target_distance']
+
+
+class ProfileSpec(NamedTuple):
+    """Arguments for a `MotionProfile`"""
+    acceleration_time: float
+    deceleration_time: float
+    max_speed: float
+    target_distance: float
+
+    @property
+    def name(self) -> str:
+        return 'a{:g}_d{:g}_v{:g}_x{:g}'.format(*self)
+
+
+def sample_profile(profile: MotionProfile, times):
+    """Positions and velocities of `profile` at each of `times`
+
+    Vectorized equivalent of calling `profile.position()` for each time.
+    """
+    import numpy
+
+    times = numpy.asarray(times, dtype=float)
+    sign = -1.0 if profile.reverse else 1.0
+    acceleration_end = profile.acceleration_end_time
+    deceleration_start = profile.deceleration_start_time
+
+    acceleration_phase_time = numpy.clip(times, 0.0, acceleration_end)
+    max_speed_phase_time = numpy.maximum(
+        0.0, numpy.minimum(times, deceleration_start) - acceleration_end)
+    deceleration_phase_time = numpy.minimum(
+        numpy.maximum(0.0, times - deceleration_start),
+        profile.end_time - deceleration_start)
+
+    positions = (
+        0.5 * profile.acceleration * acceleration_phase_time ** 2 +
+        profile.max_speed * max_speed_phase_time +
+        profile.max_speed * deceleration_phase_time +
+        0.5 * profile.deceleration * deceleration_phase_time ** 2)
+
+    velocities = numpy.select(
+        [times < acceleration_end, times < deceleration_start,
+         times < profile.end_time],
+        [profile.acceleration * times, profile.max_speed,
+         profile.max_speed + profile.deceleration *
+         (times - deceleration_start)],
+        default=0.0)
+    velocities[times < 0.0] = 0.0
+
+    return sign * positions, sign * velocities
+
+
+def summarize(spec: ProfileSpec) -> Dict[str, object]:
+    """Summary table row for a profile"""
+    profile = MotionProfile(*spec)
+    # The same test as MotionProfile, a profile that exactly reaches its
+    #  max speed is trapezoidal with no time at max speed
+    ramp_distance = 0.5 * spec.max_speed * (spec.acceleration_time +
+                                            spec.deceleration_time)
+    trapezoidal = abs(spec.target_distance) >= ramp_distance
+    row = spec._asdict()
+    row.update(
+        shape='trapezoidal' if trapezoidal else 'triangular',
+        end_time=profile.end_time,
+        peak_speed=profile.max_speed,
+        acceleration=profile.acceleration,
+        deceleration=profile.deceleration)
+    return row
+
+
+def render(spec: ProfileSpec, file_name: str, time_step: float):
+    """Plot position and velocity of a profile, run in a worker process"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot
+    import numpy
 
-import numpy
+    profile = MotionProfile(*spec)
+    times = numpy.arange(0.0, profile.end_time + time_step, time_step)
+    positions, velocities = sample_profile(profile, times)
 
-import matplotlib.pyplot
-from motion_profiles import MotionProfile
+    figure, axes = matplotlib.pyplot.subplots()
+    axes.plot(times, positions, 'C0', label='position')
+    axes.plot(times, velocities, 'C2', label='velocity')
+    axes.set_xlabel('time')
+    axes.set_title(spec.name)
+    axes.legend()
+    figure.savefig(file_name)
+    matplotlib.pyplot.close(figure)
+    return file_name
 
 
-def get_velocity(motion_profile: MotionProfile, time: float):
-    sign = -1 if motion_profile.reverse else 1
-    if time <= motion_profile.acceleration_time:
-        return motion_profile.acceleration * time * sign
-    elif time <= motion_profile.deceleration_time:
-        return motion_profile.max_speed * sign
+def parse_values(text: str) -> List[float]:
+    """Parse a comma separated list of values, where each item is either
+     a value or `start:stop:step` for an inclusive range
+
+    Raises `argparse.ArgumentTypeError` for ranges with no values, so
+     argparse reports them as usage errors.
+    """
+    values = []
+    for item in text.split(','):
+        if ':' in item:
+            start, stop, step = (float(value) for value in item.split(':'))
+            if step <= 0:
+                raise argparse.ArgumentTypeError(
+                    'range {!r} needs a positive step'.format(item))
+            if stop < start:
+                raise argparse.ArgumentTypeError(
+                    'range {!r} stops before it starts'.format(item))
+            count = int(round((stop - start) / step))
+            values.extend(start + step * index for index in range(count + 1))
+        else:
+            values.append(float(item))
+    return values
+
+
+def read_specs(file_name: str) -> List[ProfileSpec]:
+    """Read profiles from a CSV file with a column for each parameter"""
+    with open(file_name, newline='') as csv_file:
+        return [ProfileSpec(*(float(row[name]) for name in PARAMETER_NAMES))
+                for row in csv.DictReader(csv_file)]
+
+
+def source_hash() -> str:
+    """Hash of the code that evaluates and renders profiles"""
+    digest = hashlib.sha1()
+    modules = [sys.modules[MotionProfile.__module__], sys.modules[__name__]]
+    for module in modules:
+        with open(module.__file__, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def input_hash(spec: ProfileSpec, time_step: float, code_hash: str) -> str:
+    """Hash of everything a rendered plot depends on"""
+    inputs = repr((tuple(spec), time_step, code_hash))
+    return hashlib.sha1(inputs.encode()).hexdigest()
+
+
+def stale_plots(specs: List[ProfileSpec], output: str,
+                manifest: Dict[str, str], time_step: float,
+                code_hash: str) -> Dict[ProfileSpec, Tuple[str, str]]:
+    """Plot file name and input hash of each profile whose plot is
+     missing or was rendered from different inputs"""
+    stale = {}
+    for spec in specs:
+        file_name = os.path.join(output, spec.name + '.png')
+        spec_hash = input_hash(spec, time_step, code_hash)
+        if manifest.get(spec.name) != spec_hash or \
+                not os.path.exists(file_name):
+            stale[spec] = (file_name, spec_hash)
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--file', help='CSV file with a column for each of ' +
+                        ', '.join(PARAMETER_NAMES))
+    parser.add_argument('--acceleration-time', type=parse_values,
+                        default=[1.0])
+    parser.add_argument('--deceleration-time', type=parse_values,
+                        default=[1.0])
+    parser.add_argument('--max-speed', type=parse_values, default=[1.0])
+    parser.add_argument('--distance', type=parse_values,
+                        default=[0.5, 3.0, -3.0])
+    parser.add_argument('--output', default='profiles',
+                        help='Directory for plots and the summary table')
+    parser.add_argument('--time-step', type=float, default=0.005)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of plots to render in parallel')
+    parser.add_argument('--force', action='store_true',
+                        help='Render plots even if their inputs are unchanged')
+    args = parser.parse_args(argv)
+
+    if args.file:
+        specs = read_specs(args.file)
     else:
-        max_speed = (
-            motion_profile.acceleration * motion_profile.acceleration_time)
-        return (max_speed + (motion_profile.deceleration *
-                             (time - motion_profile.deceleration_time))) * sign
+        specs = [ProfileSpec(*values) for values in itertools.product(
+            args.acceleration_time, args.deceleration_time, args.max_speed,
+            args.distance)]
+    if not specs:
+        parser.error('No profiles to render')
 
+    os.makedirs(args.output, exist_ok=True)
+    manifest_name = os.path.join(args.output, 'manifest.json')
+    manifest = {}
+    if os.path.exists(manifest_name) and not args.force:
+        with open(manifest_name) as manifest_file:
+            manifest = json.load(manifest_file)
 
-def plot_profile(profile, file_name):
-    time = numpy.arange(0, profile.end_time, 0.005)
-    position = list(map(lambda time: profile.position(time), time))
-    velocity = list(map(lambda time: get_velocity(profile, time), time))
-    matplotlib.pyplot.plot(time, position, "C0")
-    matplotlib.pyplot.plot(time, velocity, "C2")
-    matplotlib.pyplot.savefig(file_name)
-    matplotlib.pyplot.close()
+    rows = [summarize(spec) for spec in specs]
 
+    stale = stale_plots(specs, args.output, manifest, args.time_step,
+                        source_hash())
 
-# Can be run as stand-alone module, will generate graphs
-#  of two test motion profiles and save them as images
-if __name__ == "__main__":
     try:
-        os.makedirs('profiles')
-    except OSError as e:
-        if e.errno != errno.EEXIST:
-            raise
-
-    triangular_profile = MotionProfile.generate_motion_profile(
-        4.5, 9 / (2.15), 9, 35.69)
-    plot_profile(triangular_profile, 'profiles/triangular_profile.png')
-    trapezoidal_profile = MotionProfile.generate_motion_profile(3, 2, 6, 24)
-    plot_profile(trapezoidal_profile, 'profiles/trapezoidal_profile.png')
-    negative_profile = MotionProfile.generate_motion_profile(4.5, 4, 9, -30)
-    plot_profile(negative_profile, 'profiles/negative_profile.png')
+        with concurrent.futures.ProcessPoolExecutor(args.jobs) as executor:
+            futures = {
+                executor.submit(render, spec, file_name, args.time_step):
+                (spec, spec_hash)
+                for spec, (file_name, spec_hash) in stale.items()}
+            for future in concurrent.futures.as_completed(futures):
+                spec, spec_hash = futures[future]
+                future.result()
+                manifest[spec.name] = spec_hash
+    finally:
+        # Keep track of the plots that did render, even if one failed
+        with open(manifest_name, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    with open(os.path.join(args.output, 'summary.csv'), 'w',
+              newline='') as summary_file:
+        writer = csv.DictWriter(summary_file, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print_table(rows)
+    print('Rendered {} of {} profiles into {}'.format(
+        len(stale), len(specs), args.output))
+
+
+if __name__ == "__main__":
+    main()
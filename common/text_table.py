@@ -0,0 +1,17 @@
+"""Print tables of results from the command line tools"""
+
+from typing import Dict, List
+
+
+def print_table(rows: List[Dict[str, object]]):
+    """Print `rows` as right aligned columns, under a header of the
+     first row's keys"""
+    columns = list(rows[0].keys())
+    cells = [[('{:.4g}'.format(row[column])
+               if isinstance(row[column], float) else str(row[column]))
+              for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[index]) for line in cells))
+              for index, column in enumerate(columns)]
+    for line in [columns] + cells:
+        print('  '.join(cell.rjust(width)
+                        for cell, width in zip(line, widths)))
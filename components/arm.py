@@ -2,6 +2,9 @@ import wpilib
 import ctre
 import enum
 
+from components.motion import MotionExecutor, MotionFuture
+from components.telemetry import Telemetry
+
 
 class Direction(enum.Enum):
     extend = True
@@ -14,14 +17,42 @@ class Arm:
     arm_motor = ctre.CANTalon
     extended_limit_switch = wpilib.DigitalInput
     retracted_limit_switch = wpilib.DigitalInput
+    motion = MotionExecutor
+    telemetry = Telemetry
     direction = Direction.retract
 
+    def setup(self):
+        self.telemetry.register('arm/extending',
+                                lambda: self.direction.value)
+        self.telemetry.register('arm/extended',
+                                lambda: self.extended_limit_switch.get())
+        self.telemetry.register('arm/retracted',
+                                lambda: self.retracted_limit_switch.get())
+
     def extend(self):
         self.direction = Direction.extend
 
     def retract(self):
         self.direction = Direction.retract
 
+    def start_extend(self) -> MotionFuture:
+        """Extend the arm while other mechanisms move, the future is
+         done once the arm is fully extended"""
+        return self.motion.submit('arm', self._extend_job)
+
+    def start_retract(self) -> MotionFuture:
+        """Retract the arm while other mechanisms move, the future is
+         done once the arm is fully retracted"""
+        return self.motion.submit('arm', self._retract_job)
+
+    def _extend_job(self):
+        self.extend()
+        return self.extended_limit_switch.get()
+
+    def _retract_job(self):
+        self.retract()
+        return self.retracted_limit_switch.get()
+
     def execute(self):
         motor_speed = 0.0
         if self.direction == Direction.extend:
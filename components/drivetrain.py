@@ -3,146 +3,266 @@ import math
 import ctre
 import wpilib
 
+from common.gain_schedule import GainSchedule, PhaseGains
+from common.input_shaping import LatencyMonitor
 from common.motion_profiles import MotionProfile, ProfileExecutor
 from common.pid import PIDCoefficients
+from common import profile_tables
+from common.profile_optimizer import ROBOT_MODEL, ProfileTable
+from components.motion import MotionExecutor, MotionFuture
+from components.telemetry import Telemetry
 
 # Only the Drivetrain needs to be used outside of this module,
 #  if we need to expose something else later we can
 __all__ = ["Drivetrain"]
 
+# The hand tuned coefficients. Every phase and move size is scheduled
+#  with them, so scheduling doesn't change how the robot drives until
+#  gains are tuned for each phase and size on the robot.
+FORWARD_COEFS = PIDCoefficients(p=1.5, i=0.6, d=0.0)
+ROTATE_COEFS = PIDCoefficients(p=0.85, i=0.3, d=0.08)
+
+FORWARD_GAINS = GainSchedule([
+    # Half a meter
+    (0.5, PhaseGains(acceleration=FORWARD_COEFS, cruise=FORWARD_COEFS,
+                     deceleration=FORWARD_COEFS)),
+    # Three meters
+    (3.0, PhaseGains(acceleration=FORWARD_COEFS, cruise=FORWARD_COEFS,
+                     deceleration=FORWARD_COEFS)),
+], max_magnitude=10.0, resolution=0.05)
+
+ROTATE_GAINS = GainSchedule([
+    # 90 degrees
+    (math.pi / 2,
+     PhaseGains(acceleration=ROTATE_COEFS, cruise=ROTATE_COEFS,
+                deceleration=ROTATE_COEFS)),
+    # 360 degrees
+    (2 * math.pi,
+     PhaseGains(acceleration=ROTATE_COEFS, cruise=ROTATE_COEFS,
+                deceleration=ROTATE_COEFS)),
+], max_magnitude=4 * math.pi, resolution=math.pi / 180)
+
+
+def arcade_feedforward(free_speed: float, acceleration_output: float):
+    """Feedforward for profiles driven through `arcadeDrive`, from the
+     drivetrain model
+
+    The motor output needed is the speed's fraction of `free_speed`,
+     plus `acceleration_output` per unit of acceleration. arcadeDrive
+     squares its inputs, so the input is the square root of that.
+    """
+    def feedforward(speed, acceleration):
+        output = speed / free_speed + acceleration * acceleration_output
+        return math.copysign(math.sqrt(min(abs(output), 1.0)), output)
+    return feedforward
+
 
 class Drivetrain:
     robot_drive = wpilib.RobotDrive
     gyro = wpilib.ADXRS450_Gyro
     arm_motor = ctre.CANTalon
+    input_latency = LatencyMonitor
+    motion = MotionExecutor
+    telemetry = Telemetry
 
     def __init__(self):
         self.rotation = 0
         self.forward_speed = 0
+        # Output sent to the motors on the last execute, for telemetry
+        self.last_rotation = 0
+        self.last_forward_speed = 0
         self.gyro_offset = 0.0
         self.profile_executor = None
+        self.profile_future = None
         self.profile_arguments = None
         self.wheel_circumference_meters = 0.48
+        # Fastest feasible profile parameters by distance, generated
+        #  ahead of time by common/profile_optimizer.py
+        self.forward_profiles = ProfileTable(
+            profile_tables.FORWARD, profile_tables.FORWARD_RESOLUTION)
+        self.rotate_profiles = ProfileTable(
+            profile_tables.ROTATE, profile_tables.ROTATE_RESOLUTION)
+
+    def setup(self):
+        self.telemetry.register('drivetrain/forward_speed',
+                                lambda: self.last_forward_speed, 0.01)
+        self.telemetry.register('drivetrain/rotation',
+                                lambda: self.last_rotation, 0.01)
+        self.telemetry.register('drivetrain/gyro_angle',
+                                lambda: self.gyro.getAngle(), 0.5)
+        self.telemetry.register('drivetrain/profile_running',
+                                lambda: self.motion.busy('drivetrain'))
+        self.telemetry.register('drivetrain/profile_goal',
+                                lambda: self._profile_value('goal'), 0.001)
+        self.telemetry.register('drivetrain/profile_input',
+                                lambda: self._profile_value('input'), 0.001)
+        self.telemetry.register(
+            'drivetrain/profile_output',
+            lambda: self._profile_value('last_output'), 0.01)
 
     def forward_at(self, speed):
         self.forward_speed = speed
 
-    def turn_at(self, speed, squaredInputs=False):
+    def turn_at(self, speed):
         self.rotation = speed
-        if squaredInputs:
-            self.rotation = speed**2 if speed >= 0 else -(speed**2)
 
-    def forward(self, feet=0, inches=0, meters=0, max_speed=1):
+    def forward(self, feet=0, inches=0, meters=0, max_speed=None):
         """Use a motion profile and PID control to efficiently
          move the robot the specified distance forward
 
         Call repeatedly with the same arguments to update, use
-         `cancel_motion_profile`, then call again to change target.
+         `reset_motion_profile`, then call again to change target.
 
         Returns `False` while executing, `True` once done. Continuing
-         to update when done will start new profile.
+         to update when done will start new profile. If the profile is
+         cancelled, keeps returning `False` until `reset_motion_profile`
+         is called.
 
-        `max_speed` is in units of meters per second"""
+        The profile is the fastest the drivetrain can follow, `max_speed`
+         limits its speed further, in units of meters per second"""
         # 1 inch = 0.0254 meters
         # 1 foot = 0.3048 meters
         distance = (inches * 0.0254) + (feet * 0.3048) + meters
 
-        # When called with the same arguments, update executor
+        # When called with the same arguments, check on the profile
         if distance == self.profile_arguments:
-            return self._update_executor()
+            return self._profile_done()
 
         # When target is switched without calling
-        #  cancel_motion_profile, issue warning
+        #  reset_motion_profile, issue warning
         if self.profile_arguments is not None:
-            print("Use Drivetrain.cancel_motion_profile to change profile!",
+            print("Use Drivetrain.reset_motion_profile to change profile!",
                   "Switching to new profile...")
 
+        self.start_forward(meters=distance, max_speed=max_speed)
         self.profile_arguments = distance
 
+        return False
+
+    def start_forward(self, feet=0, inches=0, meters=0,
+                      max_speed=None) -> MotionFuture:
+        """Start moving the robot the specified distance forward, like
+         `forward`, and return the move's future
+
+        The profile is run by the `MotionExecutor`, so other mechanisms
+         can move at the same time. Wait for the future to be done.
+        """
+        distance = (inches * 0.0254) + (feet * 0.3048) + meters
+
+        parameters = self.forward_profiles.lookup(distance)
+        if max_speed is not None:
+            parameters = parameters.limit_speed(max_speed)
+
         motion_profile = MotionProfile(
-            acceleration_time=1,
-            deceleration_time=1,
-            max_speed=max_speed,
+            acceleration_time=parameters.acceleration_time,
+            deceleration_time=parameters.deceleration_time,
+            max_speed=parameters.max_speed,
             target_distance=distance)
 
-        coefs = PIDCoefficients(p=1.5, i=0.6, d=0.0)
-
         # Set current position to zero
         self._reset_encoder_position()
 
-        self.profile_executor = ProfileExecutor(
-            coefs, motion_profile,
+        executor = ProfileExecutor(
+            FORWARD_GAINS, motion_profile,
             lambda: (self._get_encoder_position()/360) * self.wheel_circumference_meters,
-            lambda output: self.forward_at(output), 0.01)
+            lambda output: self.forward_at(output), 0.01,
+            arcade_feedforward(ROBOT_MODEL.free_speed,
+                               ROBOT_MODEL.acceleration_output))
 
-        return False
+        return self._start_profile(executor)
 
-    def backward(self, feet=0, inches=0, meters=0, max_speed=1):
+    def backward(self, feet=0, inches=0, meters=0, max_speed=None):
         """Use a motion profile and PID control to efficiently
          move the robot the specified distance backward
 
         Call repeatedly with the same arguments to update, use
-         `cancel_motion_profile`, then call again to change target.
+         `reset_motion_profile`, then call again to change target.
 
         Returns `False` while executing, `True` once done. Continuing
          to update when done will start new profile.
 
-        `max_speed` is in units of meters per second"""
+        `max_speed` optionally limits the speed, in meters per second"""
         return self.forward(-feet, -inches, -meters, max_speed)
 
-    def rotate(self, degrees=0, max_speed=5):
+    def rotate(self, degrees=0, max_speed=None):
         """Use a motion profile and PID control to efficiently
          turn the robot the number of degrees - positive is clockwise,
          negative is counter-clockwise
 
         Call repeatedly with the same arguments to update, use
-         `cancel_motion_profile`, then call again to change target.
+         `reset_motion_profile`, then call again to change target.
 
         Returns `False` while executing, `True` once done. Continuing
-         to update when done will start new profile.
+         to update when done will start new profile. If the profile is
+         cancelled, keeps returning `False` until `reset_motion_profile`
+         is called.
 
-        `max_speed` is in units of degrees per second"""
+        The profile is the fastest the drivetrain can follow, `max_speed`
+         limits its speed further, in units of radians per second"""
         radians = degrees * (math.pi / 180)
 
-        # When called with the same arguments, update executor
+        # When called with the same arguments, check on the profile
         if radians == self.profile_arguments:
-            return self._update_executor()
+            return self._profile_done()
 
         # When target is switched, issue warning
         if self.profile_arguments is not None:
-            print("Use Drivetrain.cancel_motion_profile to change profile!",
+            print("Use Drivetrain.reset_motion_profile to change profile!",
                   "Switching to new profile...")
 
+        self.start_rotate(degrees, max_speed)
         self.profile_arguments = radians
 
+        return False
+
+    def start_rotate(self, degrees=0, max_speed=None) -> MotionFuture:
+        """Start turning the robot the number of degrees, like `rotate`,
+         and return the turn's future
+
+        The profile is run by the `MotionExecutor`, so other mechanisms
+         can move at the same time. Wait for the future to be done.
+        """
+        radians = degrees * (math.pi / 180)
+
+        parameters = self.rotate_profiles.lookup(radians)
+        if max_speed is not None:
+            parameters = parameters.limit_speed(max_speed)
+
         motion_profile = MotionProfile(
-            acceleration_time=0.7,
-            deceleration_time=1.4,
-            max_speed=max_speed,
+            acceleration_time=parameters.acceleration_time,
+            deceleration_time=parameters.deceleration_time,
+            max_speed=parameters.max_speed,
             target_distance=radians)
 
         self._zero_gyro()
 
-        coefs = PIDCoefficients(p=0.85, i=0.3, d=0.08)
-        self.profile_executor = ProfileExecutor(
-            coefs, motion_profile, lambda: self._get_gyro_angle(),
-            lambda output: self.turn_at(-output), 0.003)
+        executor = ProfileExecutor(
+            ROTATE_GAINS, motion_profile, lambda: self._get_gyro_angle(),
+            lambda output: self.turn_at(-output), 0.003,
+            arcade_feedforward(ROBOT_MODEL.free_angular_speed,
+                               ROBOT_MODEL.angular_acceleration_output))
 
-        return False
+        return self._start_profile(executor)
 
     def reset_motion_profile(self):
         # Resets or cancels motion profile
+        if self.profile_future is not None:
+            self.profile_future.cancel()
         self.profile_executor = None
+        self.profile_future = None
         self.profile_arguments = None
 
     def execute(self):
-        self.robot_drive.arcadeDrive(self.forward_speed, self.rotation)
+        with self.input_latency.output():
+            self.robot_drive.arcadeDrive(self.forward_speed, self.rotation)
 
+        self.last_forward_speed = self.forward_speed
+        self.last_rotation = self.rotation
         self.rotation = 0
         self.forward_speed = 0
 
-    def on_disabled(self):
-        self.cancel_motion_profile()
+    def on_disable(self):
+        self.reset_motion_profile()
 
     def _reset_encoder_position(self):
         self.arm_motor.setEncPosition(0)
@@ -157,9 +277,28 @@ class Drivetrain:
     def _get_gyro_angle(self):
         return (self.gyro.getAngle() - self.gyro_offset) * (math.pi / 180.0) * 1.013
 
-    def _update_executor(self):
-        executor_finished = self.profile_executor.update()
-        if executor_finished:
+    def _profile_value(self, name):
+        if self.profile_executor is None:
+            return 0.0
+        return getattr(self.profile_executor, name)
+
+    def _start_profile(self, executor):
+        # Replaces any profile that's already running
+        self.reset_motion_profile()
+        self.profile_executor = executor
+        self.profile_future = self.motion.submit(
+            'drivetrain', self.profile_executor.update)
+        return self.profile_future
+
+    def _profile_done(self):
+        if self.profile_future.finished():
             self.reset_motion_profile()
             return True
+        # A cancelled profile isn't done, and isn't restarted either,
+        #  since whatever cancelled it wants the drivetrain stopped
+        if (self.profile_future.cancelled() and
+                self.profile_executor is not None):
+            print("Motion profile was cancelled!",
+                  "Use Drivetrain.reset_motion_profile to start again")
+            self.profile_executor = None
         return False
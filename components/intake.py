@@ -2,6 +2,8 @@ import ctre
 import wpilib
 import enum
 
+from components.telemetry import Telemetry
+
 
 class Action(enum.Enum):
     Intake = 1
@@ -14,11 +16,19 @@ class Intake:
     intake_motor = ctre.CANTalon
     intake_pdp_channel = int
     pdp = wpilib.PowerDistributionPanel
+    telemetry = Telemetry
     # Max current in amps to draw before stopping the motor
     max_current = 6
     release_bunny = False
     holding_bunny = False
 
+    def setup(self):
+        self.telemetry.register('intake/holding_bunny',
+                                lambda: self.holding_bunny)
+        self.telemetry.register(
+            'intake/current',
+            lambda: self.pdp.getCurrent(self.intake_pdp_channel), 0.25)
+
     def spit_bunny(self):
         """Spit out a bunny if one is being held"""
         self.release_bunny = True
@@ -0,0 +1,88 @@
+"""Run motion jobs for several mechanisms at the same time"""
+
+from collections import OrderedDict
+from typing import Callable
+
+
+class MotionFuture:
+    """Completion of a job submitted to the `MotionExecutor`
+
+    Autonomous states can poll `done()` to wait for a move, while
+     other mechanisms keep moving.
+    """
+
+    def __init__(self, executor: 'MotionExecutor', mechanism: str):
+        self.mechanism = mechanism
+        self._executor = executor
+        self._finished = False
+        self._cancelled = False
+
+    def done(self) -> bool:
+        """`True` once the job has finished or been cancelled"""
+        return self._finished or self._cancelled
+
+    def finished(self) -> bool:
+        """`True` if the job ran to completion"""
+        return self._finished
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """Stop the job if it's still running"""
+        self._executor._cancel_future(self)
+
+
+class MotionExecutor:
+    """Updates motion jobs for every mechanism once per loop
+
+    A job is a function, like `ProfileExecutor.update`, that writes its
+     mechanism's output and returns `True` once the move is complete.
+     Each mechanism runs one job at a time, jobs for different mechanisms
+     run together.
+
+    Declare this component before the mechanisms it drives, so their
+     outputs are written before they execute.
+    """
+
+    def __init__(self):
+        # Running jobs and their futures, by mechanism
+        self.jobs = OrderedDict()
+
+    def submit(self, mechanism: str,
+               job: Callable[[], bool]) -> MotionFuture:
+        """Start running `job` for `mechanism`, replacing any job the
+         mechanism is already running"""
+        self.cancel(mechanism)
+        future = MotionFuture(self, mechanism)
+        self.jobs[mechanism] = (job, future)
+        return future
+
+    def busy(self, mechanism: str) -> bool:
+        """Whether `mechanism` is running a job"""
+        return mechanism in self.jobs
+
+    def cancel(self, mechanism: str):
+        """Stop the job running for `mechanism`, if there is one"""
+        if mechanism in self.jobs:
+            _, future = self.jobs.pop(mechanism)
+            future._cancelled = True
+
+    def cancel_all(self):
+        for mechanism in list(self.jobs):
+            self.cancel(mechanism)
+
+    def _cancel_future(self, future: MotionFuture):
+        # Only cancel the job if it hasn't been replaced already
+        job = self.jobs.get(future.mechanism)
+        if job is not None and job[1] is future:
+            self.cancel(future.mechanism)
+
+    def execute(self):
+        for mechanism, (job, future) in list(self.jobs.items()):
+            if job():
+                del self.jobs[mechanism]
+                future._finished = True
+
+    def on_disable(self):
+        self.cancel_all()
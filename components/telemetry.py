@@ -0,0 +1,133 @@
+"""Rate limited, delta encoded telemetry for the driver station"""
+
+from collections import OrderedDict
+from typing import Any, Callable
+
+import wpilib
+from networktables import NetworkTables
+from networktables.networktable import NetworkTable
+
+# Approximate size in bytes of an entry update message, excluding the value
+ENTRY_HEADER_SIZE = 5
+
+
+def encoded_size(value: Any) -> int:
+    """Approximate number of bytes NetworkTables uses to send `value`"""
+    if isinstance(value, bool):
+        return ENTRY_HEADER_SIZE + 1
+    if isinstance(value, (int, float)):
+        return ENTRY_HEADER_SIZE + 8
+    return ENTRY_HEADER_SIZE + 2 + len(str(value))
+
+
+class Telemetry:
+    """Publishes values registered by other components to NetworkTables
+
+    Values are sampled once per publish interval, and only values that
+    changed since they were last published are sent. Changes that don't fit
+    in a batch's bandwidth budget are coalesced with later changes to the
+    same value, and sent first in the next batch. The publish interval
+    backs off while the robot loop overruns its period, and recovers once
+    there is headroom again.
+    """
+
+    table = NetworkTable
+
+    # Bandwidth budget in bytes per second
+    bandwidth = 4000
+    # Shortest and longest time between batches, in seconds
+    min_interval = 0.1
+    max_interval = 1.0
+    # Robot loop period in seconds, and how far the measured period may
+    #  exceed it before publishing backs off
+    loop_period = 0.02
+    overrun_ratio = 1.1
+
+    def __init__(self):
+        self.sources = OrderedDict()
+        self.tolerances = {}
+        # Last value sent for each key
+        self.published = {}
+        # Changed values waiting to be sent, oldest change first
+        self.pending = OrderedDict()
+        self.interval = self.min_interval
+        self.average_loop_period = self.loop_period
+        self.last_loop_time = None
+        self.last_publish_time = None
+        self.clock = wpilib.Timer.getFPGATimestamp
+
+    def register(self, key: str, source: Callable[[], Any],
+                 tolerance: float = 0.0):
+        """Publish the value returned by `source` under `key`
+
+        Numeric values are only considered changed when they differ from
+         the last published value by more than `tolerance`.
+        """
+        self.sources[key] = source
+        self.tolerances[key] = tolerance
+
+    def execute(self):
+        now = self.clock()
+
+        if self.last_loop_time is not None:
+            # Exponential moving average of the loop period
+            period = now - self.last_loop_time
+            self.average_loop_period += 0.1 * (
+                period - self.average_loop_period)
+        self.last_loop_time = now
+
+        if (self.last_publish_time is not None and
+                now - self.last_publish_time < self.interval):
+            return
+
+        self.last_publish_time = now
+        self._update_interval()
+        self._collect_changes()
+        self._publish_batch()
+
+    def _update_interval(self):
+        if self.average_loop_period > self.loop_period * self.overrun_ratio:
+            self.interval = min(self.interval * 2, self.max_interval)
+        else:
+            self.interval = max(self.interval * 0.8, self.min_interval)
+
+    def _collect_changes(self):
+        for key, source in self.sources.items():
+            value = source()
+            if self._changed(key, value):
+                # Keep the position of an already pending key, so
+                #  it isn't starved by values that change every batch
+                self.pending[key] = value
+            else:
+                self.pending.pop(key, None)
+
+    def _changed(self, key, value) -> bool:
+        if key not in self.published:
+            return True
+        previous = self.published[key]
+        if (isinstance(value, (int, float)) and
+                not isinstance(value, bool) and
+                isinstance(previous, (int, float)) and
+                not isinstance(previous, bool)):
+            return abs(value - previous) > self.tolerances[key]
+        return value != previous
+
+    def _publish_batch(self):
+        budget = self.bandwidth * self.interval
+        sent = []
+        for key, value in self.pending.items():
+            size = encoded_size(value)
+            # Always send at least one value, so a budget smaller than
+            #  a single value can't stall publishing
+            if sent and size > budget:
+                break
+            budget -= size
+            self.table.putValue(key, value)
+            self.published[key] = value
+            sent.append(key)
+
+        for key in sent:
+            del self.pending[key]
+
+        if sent:
+            NetworkTables.flush()
@@ -1,31 +1,213 @@
-from pyfrc.physics.drivetrains import two_motor_drivetrain
+import math
+from collections import defaultdict
+
+from common.drivetrain_model import GRAVITY, DrivetrainModel
+
+# 1 foot = 0.3048 meters
+METERS_PER_FOOT = 0.3048
+
+# CAN outputs to the hal are multiplied by the duty cycle, 1023
+TALON_DUTY_CYCLE = 1023
+
+
+def separated(polygon_a, polygon_b):
+    """Whether two convex polygons don't overlap, using the
+     separating axis theorem"""
+    for polygon in (polygon_a, polygon_b):
+        for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+            # Normal to the edge
+            axis_x, axis_y = y1 - y2, x2 - x1
+            projections_a = [x * axis_x + y * axis_y for x, y in polygon_a]
+            projections_b = [x * axis_x + y * axis_y for x, y in polygon_b]
+            if (max(projections_a) < min(projections_b) or
+                    max(projections_b) < min(projections_a)):
+                return True
+    return False
+
+
+class SpatialIndex:
+    """Grid over the field of which polygons overlap each cell, so
+     collision checks only test polygons near the robot"""
+
+    def __init__(self, polygons, cell_size=2.0):
+        self.polygons = polygons
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        for index, polygon in enumerate(polygons):
+            for cell in self._cells(polygon):
+                self.cells[cell].append(index)
+
+    def _cells(self, points):
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        for cell_x in range(int(math.floor(min(xs) / self.cell_size)),
+                            int(math.floor(max(xs) / self.cell_size)) + 1):
+            for cell_y in range(int(math.floor(min(ys) / self.cell_size)),
+                                int(math.floor(max(ys) / self.cell_size)) + 1):
+                yield cell_x, cell_y
+
+    def collides(self, polygon):
+        """Whether `polygon` overlaps any of the indexed polygons"""
+        checked = set()
+        for cell in self._cells(polygon):
+            for index in self.cells.get(cell, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if not separated(polygon, self.polygons[index]):
+                    return True
+        return False
 
 
 class PhysicsEngine:
-    """ This is the engine which runs with the sim """
+    """ This is the engine which runs with the sim
+
+    Each update is split into sub-steps, which integrate a DC motor model
+    for each side of the drivetrain, including back-EMF, battery sag,
+    current limits, traction and the robot's inertia. The robot stops
+    when it would hit one of the field objects in sim/config.json.
+    """
 
     def __init__(self, controller):
         self.controller = controller
         self.controller.add_device_gyro_channel('adxrs450_spi_0_angle')
-        self.encoder_position = 0.0
+
+        config = controller.config_obj
+        self.substeps = config.get('physics', {}).get('substeps', 10)
+        # Robot's length along its heading, and width, in feet
+        self.robot_length = config['pyfrc']['robot']['w']
+        self.robot_width = config['pyfrc']['robot']['h']
+
+        self.field = SpatialIndex([
+            [tuple(point) for point in field_object['points']]
+            for field_object in config['pyfrc']['field']['objects']])
+
+        self.model = DrivetrainModel(
+            wheel_radius=0.48 / (2 * math.pi),
+            track_width=self.robot_width * METERS_PER_FOOT)
+
+        # Forward speed in meters per second, and clockwise
+        #  rotation speed in radians per second
+        self.speed = 0.0
+        self.rotation_speed = 0.0
+        # Distance each side's wheels have traveled, in meters
+        self.left_position = 0.0
+        self.right_position = 0.0
+        # Total current drawn on the last sub-step, for battery sag
+        self.current = 0.0
+        self.collisions = 0
 
     def update_sim(self, hal_data, now, tm_diff):
         """ Updates the simulation with new robot positions """
 
-        front_left = -hal_data['CAN'][1]['value']
-        front_right = hal_data['CAN'][3]['value']
+        # The drivetrain's positive forward output drives the left
+        #  motors positive and the right motors negative
+        left_output = hal_data['CAN'][1]['value'] / TALON_DUTY_CYCLE
+        right_output = -hal_data['CAN'][3]['value'] / TALON_DUTY_CYCLE
+
+        step = tm_diff / self.substeps
+        distance = 0.0
+        angle = 0.0
+        left_position = self.left_position
+        right_position = self.right_position
+        speed = self.speed
+        rotation_speed = self.rotation_speed
+        for _ in range(self.substeps):
+            speed, rotation_speed = self._step(
+                left_output, right_output, speed, rotation_speed, step)
+            half_track = self.model.track_width / 2
+            left_position += (speed + rotation_speed * half_track) * step
+            right_position += (speed - rotation_speed * half_track) * step
+            distance += speed * step
+            angle += rotation_speed * step
+
+        if self.controller.robot_enabled and \
+                self._collides(distance / METERS_PER_FOOT, angle):
+            # Stop dead against field objects, with the wheels stalled
+            self.collisions += 1
+            self.speed = 0.0
+            self.rotation_speed = 0.0
+            return
+
+        left_change = left_position - self.left_position
+        right_change = right_position - self.right_position
+        self.speed = speed
+        self.rotation_speed = rotation_speed
+        self.left_position = left_position
+        self.right_position = right_position
+        self.controller.drive(distance / METERS_PER_FOOT / tm_diff,
+                              angle / tm_diff, tm_diff)
+
+        # Encoders count changes in position, so robot code can still
+        #  reset them. Matches the Drivetrain's conversion from encoder
+        #  position to meters
+        ticks_per_meter = 11.3 * 360 / 0.48
+        hal_data['CAN'][1]['enc_position'] += left_change * ticks_per_meter
+        hal_data['CAN'][3]['enc_position'] += right_change * ticks_per_meter
+        # The Drivetrain reads the left encoder through the arm's Talon
+        hal_data['CAN'][5]['enc_position'] += left_change * ticks_per_meter
+
+    def _step(self, left_output, right_output, speed, rotation_speed, dt):
+        model = self.model
+        half_track = model.track_width / 2
+
+        # Battery voltage sags with the current drawn on the last step
+        voltage = model.battery.voltage - (
+            self.current * model.battery.resistance)
+
+        left_force, left_current = self._side(
+            left_output * voltage, speed + rotation_speed * half_track)
+        right_force, right_current = self._side(
+            right_output * voltage, speed - rotation_speed * half_track)
+        self.current = left_current + right_current
+
+        acceleration = (left_force + right_force) / model.mass
+        inertia = model.mass * model.gyration_radius ** 2
+        torque = (left_force - right_force) * half_track
+        # Wheels scrub sideways while turning, limiting the torque
+        max_torque = (model.traction_coefficient * model.turning_traction *
+                      model.mass * GRAVITY * half_track)
+        torque = max(-max_torque, min(torque, max_torque))
+
+        return (speed + acceleration * dt,
+                rotation_speed + torque / inertia * dt)
+
+    def _side(self, voltage, wheel_speed):
+        """Force on the ground and total current drawn by one side of
+         the drivetrain"""
+        model = self.model
+        motor = model.motor
+        motor_speed = wheel_speed * model.gear_ratio / model.wheel_radius
+        current = (voltage - motor_speed / motor.kv) / motor.resistance
+        current = max(-model.current_limit, min(current, model.current_limit))
 
-        # CAN outputs to the hal are multiplied by the duty cycle, 1023
-        talon_duty_cycle = 1023
-        # Quadrature encoders have 4 edges per revolution
-        edges_per_revolution = 4
-        position_change = (front_left / talon_duty_cycle) * tm_diff
-        self.encoder_position += position_change * edges_per_revolution
+        # Friction in the motor and gearbox, modeled as viscous so it
+        #  uses the free current at free speed
+        friction_current = motor.free_current * motor_speed / motor.free_speed
+        torque = motor.kt * (current - friction_current)
+        force = (model.motors_per_side * torque * model.gear_ratio /
+                 model.wheel_radius)
 
-        # Scale encoder value for sim
-        hal_data['CAN'][1]['enc_position'] = 9.98 * self.encoder_position
+        traction = model.traction_coefficient * model.mass * GRAVITY / 2
+        force = max(-traction, min(force, traction))
+        return force, model.motors_per_side * abs(current)
 
-        rotation, speed = two_motor_drivetrain(front_left, front_right, 3,
-                                               0.025)
+    def _collides(self, distance, angle):
+        # Predict the pose the same way the sim's drive() moves the robot
+        x, y, heading = self.controller.get_position()
+        relative_x = distance * math.cos(angle)
+        relative_y = distance * math.sin(angle)
+        heading += angle
+        cos = math.cos(heading)
+        sin = math.sin(heading)
+        x += relative_x * cos - relative_y * sin
+        y += relative_x * sin + relative_y * cos
 
-        self.controller.drive(speed, rotation, tm_diff)
+        half_length = self.robot_length / 2
+        half_width = self.robot_width / 2
+        corners = [(half_length, half_width), (-half_length, half_width),
+                   (-half_length, -half_width), (half_length, -half_width)]
+        robot = [(x + corner_x * cos - corner_y * sin,
+                  y + corner_x * sin + corner_y * cos)
+                 for corner_x, corner_y in corners]
+        return self.field.collides(robot)
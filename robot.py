@@ -1,28 +1,68 @@
 #!/usr/bin/env python3
 
-import wpilib
-from ctre.cantalon import CANTalon
-from magicbot import MagicRobot
+from common.boot_profiler import BootProfiler
 
-from components.drivetrain import Drivetrain
-from components.intake import Intake
-from components.flipper import Flipper
-from components.arm import Arm
+# Start profiling before anything else is imported, so the boot report
+#  covers every import
+boot_profiler = BootProfiler()
+boot_profiler.install()
+
+import wpilib  # noqa: E402
+from ctre.cantalon import CANTalon  # noqa: E402
+from magicbot import MagicRobot  # noqa: E402
+from networktables import NetworkTables  # noqa: E402
+
+from common.input_shaping import (Deadband, ExpoCurve,  # noqa: E402
+                                  InputPipeline, LatencyMonitor,
+                                  SlewRateLimiter)
+from components.drivetrain import Drivetrain  # noqa: E402
+from components.intake import Intake  # noqa: E402
+from components.flipper import Flipper  # noqa: E402
+from components.arm import Arm  # noqa: E402
+from components.motion import MotionExecutor  # noqa: E402
+from components.telemetry import Telemetry  # noqa: E402
 
 
 class Robot(MagicRobot):
 
+    # Components execute in the order they're declared, motion jobs
+    #  have to write their outputs before the mechanisms execute
+    motion = MotionExecutor
     drivetrain = Drivetrain
     intake = Intake
     flipper = Flipper
     arm = Arm
+    telemetry = Telemetry
+
+    def robotInit(self):
+        try:
+            with boot_profiler.section('robotInit'):
+                super().robotInit()
+        finally:
+            # Remove the import hooks even if the robot fails to start
+            boot_profiler.finish()
+        self.logger.info(boot_profiler.report())
+        self.telemetry.register('robot/boot_time',
+                                lambda: boot_profiler.total_time)
+
+        latency = self.input_latency
+        for name, statistic in [('latency', latency.latency),
+                                ('loop_period', latency.loop_period),
+                                ('shaping_time', latency.shaping_time),
+                                ('write_time', latency.write_time)]:
+            self.telemetry.register('input/' + name,
+                                    lambda s=statistic: s.average, 0.0005)
+            self.telemetry.register('input/max_' + name,
+                                    lambda s=statistic: s.max, 0.0005)
 
     def createObjects(self):
+        create = boot_profiler.create
+
         # Drivetrain
-        self.front_left_motor = CANTalon(1)
-        self.back_left_motor = CANTalon(2)
-        self.front_right_motor = CANTalon(3)
-        self.back_right_motor = CANTalon(4)
+        self.front_left_motor = create(CANTalon, 1)
+        self.back_left_motor = create(CANTalon, 2)
+        self.front_right_motor = create(CANTalon, 3)
+        self.back_right_motor = create(CANTalon, 4)
 
         self.back_left_motor.setControlMode(CANTalon.ControlMode.Follower)
         self.back_right_motor.setControlMode(CANTalon.ControlMode.Follower)
@@ -30,31 +70,49 @@ class Robot(MagicRobot):
         self.back_left_motor.set(self.front_left_motor.getDeviceID())
         self.back_right_motor.set(self.front_right_motor.getDeviceID())
 
-        self.robot_drive = wpilib.RobotDrive(self.front_left_motor,
-                                             self.front_right_motor)
+        self.robot_drive = create(wpilib.RobotDrive, self.front_left_motor,
+                                  self.front_right_motor)
 
         # Arm
-        self.extended_limit_switch = wpilib.DigitalInput(0)
-        self.retracted_limit_switch = wpilib.DigitalInput(1)
-        self.arm_motor = CANTalon(5)
+        self.extended_limit_switch = create(wpilib.DigitalInput, 0)
+        self.retracted_limit_switch = create(wpilib.DigitalInput, 1)
+        self.arm_motor = create(CANTalon, 5)
 
-        self.drivetrain_gyro = wpilib.ADXRS450_Gyro()
+        self.drivetrain_gyro = create(wpilib.ADXRS450_Gyro)
 
         # Intake
-        self.intake_motor = CANTalon(6)
+        self.intake_motor = create(CANTalon, 6)
         self.intake_pdp_channel = 0
-        self.pdp = wpilib.PowerDistributionPanel()
+        self.pdp = create(wpilib.PowerDistributionPanel)
+
+        self.flipper_motor = create(wpilib.Talon, 1)
 
-        self.flipper_motor = wpilib.Talon(1)
+        # Telemetry
+        self.telemetry_table = NetworkTables.getTable('Telemetry')
 
         # Joysticks
-        self.drive_joystick = wpilib.Joystick(0)
-        self.operator_joystick = wpilib.Joystick(1)
+        self.drive_joystick = create(wpilib.Joystick, 0)
+        self.operator_joystick = create(wpilib.Joystick, 1)
+
+        # Driver input shaping
+        self.forward_input = InputPipeline(
+            Deadband(0.05), SlewRateLimiter(rate=6.0))
+        # Squared rotation gives finer control when aiming
+        self.rotation_input = InputPipeline(Deadband(0.05), ExpoCurve(2))
+        self.input_latency = LatencyMonitor()
+
+    def teleopInit(self):
+        # Input latency statistics cover only this enable
+        self.input_latency.reset()
 
     def teleopPeriodic(self):
-        self.drivetrain.turn_at(
-            -self.drive_joystick.getRawAxis(0), squaredInputs=True)
-        self.drivetrain.forward_at(-self.drive_joystick.getRawAxis(1))
+        self.input_latency.mark_input()
+        rotation = self.rotation_input(-self.drive_joystick.getRawAxis(0))
+        forward = self.forward_input(-self.drive_joystick.getRawAxis(1))
+        self.input_latency.mark_shaped()
+
+        self.drivetrain.turn_at(rotation)
+        self.drivetrain.forward_at(forward)
 
         if self.drive_joystick.getRawButton(4):
             self.intake.spit_bunny()
@@ -69,6 +127,11 @@ class Robot(MagicRobot):
         else:
             self.arm.retract()
 
+    def disabledPeriodic(self):
+        # Components aren't executed while disabled, but the
+        #  driver station should still see sensor values
+        self.telemetry.execute()
+
 
 if __name__ == '__main__':
     wpilib.run(Robot)
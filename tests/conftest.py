@@ -0,0 +1,40 @@
+"""Test doubles shared by the test modules"""
+
+import pytest
+
+from common import motion_profiles, pid
+
+
+class FakeClock:
+    """Clock function that only moves when `time` is changed"""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+class FakeTimer:
+    """wpilib's Timer, with a timestamp that only moves when `time` is
+     changed"""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def getFPGATimestamp(self):
+        return self.time
+
+
+@pytest.fixture
+def fake_timer(monkeypatch):
+    """Replace the Timer used by the PID controller and motion profiles"""
+    timer = FakeTimer()
+    monkeypatch.setattr(pid, 'Timer', timer)
+    monkeypatch.setattr(motion_profiles.wpilib, 'Timer', timer)
+    return timer
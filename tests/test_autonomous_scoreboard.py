@@ -0,0 +1,48 @@
+"""Test module for autonomous_scoreboard.py"""
+
+import math
+
+import pytest
+
+from common.autonomous_scoreboard import (heading_difference, relative_pose,
+                                          table_row)
+
+
+class TestScoreboard:
+    """Test class for the autonomous scoreboard's scoring"""
+
+    def test_relative_pose(self):
+        """Poses are relative to the start pose's position and heading"""
+        # Facing down the field's y axis, clockwise is towards -x
+        start = (2.0, 3.0, math.pi / 2)
+        forward, right, heading = relative_pose(start, (1.0, 7.0, math.pi))
+        assert forward == pytest.approx(4.0)
+        assert right == pytest.approx(1.0)
+        assert heading == pytest.approx(90.0)
+
+    def test_heading_difference_wraps(self):
+        """Headings a whole number of turns apart are the same"""
+        assert heading_difference(350, 10) == pytest.approx(20)
+        assert heading_difference(-170, 170) == pytest.approx(20)
+        assert heading_difference(720, 0) == pytest.approx(0)
+        assert heading_difference(180, 0) == pytest.approx(180)
+
+    def test_table_row_changes(self):
+        """Rows show changes from the compared results, if there are any"""
+        result = dict(mode='Forward', finished=True, time=3.0,
+                      position_error=0.1, heading_error=None,
+                      peak_forward=1.0, peak_rotation=0.0,
+                      cpu_per_loop=0.001, max_cpu_per_loop=0.002,
+                      collisions=0)
+        previous = dict(result, time=3.5, position_error=0.3,
+                        cpu_per_loop=0.0015)
+
+        row = table_row(result, True, previous)
+        assert row['mode'] == 'Forward *'
+        assert row['heading_error'] == '-'
+        assert row['time_change'] == '-0.5'
+        assert row['position_error_change'] == '-0.2'
+        assert row['heading_error_change'] == '-'
+        assert row['cpu_per_loop'] == pytest.approx(1.0)
+        assert row['cpu_per_loop_change'] == '-0.5'
+        assert 'time_change' not in table_row(result, False, None)
@@ -0,0 +1,138 @@
+"""Test module for boot_profiler.py"""
+
+import builtins
+import importlib
+import sys
+
+import pytest
+
+from common import boot_profiler
+from common.boot_profiler import BootProfiler
+
+
+class FakeTime:
+    time = 0.0
+
+    @classmethod
+    def perf_counter(cls):
+        return cls.time
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    FakeTime.time = 0.0
+    monkeypatch.setattr(boot_profiler, 'time', FakeTime)
+    return FakeTime
+
+
+@pytest.fixture
+def package(tmpdir, monkeypatch):
+    """A package with a submodule, that hasn't been imported yet"""
+    package_dir = tmpdir.mkdir('boot_profiler_package')
+    package_dir.join('__init__.py').write('')
+    package_dir.join('submodule.py').write('VALUE = 1\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    yield 'boot_profiler_package'
+    for name in list(sys.modules):
+        if name.startswith('boot_profiler_package'):
+            del sys.modules[name]
+
+
+class DeviceStub:
+    pass
+
+
+class TestBootProfiler:
+    """Test class for BootProfiler"""
+
+    def test_exclusive_import_times(self, fake_time):
+        """Time spent importing dependencies isn't counted against the
+         module that imports them"""
+        profiler = BootProfiler()
+
+        def import_dependency():
+            fake_time.time += 2.0
+
+        def import_module():
+            fake_time.time += 1.0
+            profiler._time('dependency', import_dependency)
+            fake_time.time += 0.5
+
+        profiler._time('module', import_module)
+        profiler._time('other', lambda: setattr(fake_time, 'time',
+                                                fake_time.time + 0.25))
+
+        assert profiler.import_times == pytest.approx(
+            {'module': 1.5, 'dependency': 2.0, 'other': 0.25})
+
+    def test_nested_import_times(self, fake_time):
+        """Every level of nested imports is exclusive"""
+        profiler = BootProfiler()
+
+        def nested(depth):
+            fake_time.time += 1.0
+            if depth < 3:
+                profiler._time('level %d' % (depth + 1), nested, depth + 1)
+
+        profiler._time('level 0', nested, 0)
+
+        assert profiler.import_times == pytest.approx(
+            {'level %d' % depth: 1.0 for depth in range(4)})
+
+    def test_from_import_times_submodules(self, package):
+        """Submodules loaded by `from package import submodule` are
+         timed separately from the package"""
+        profiler = BootProfiler()
+        profiler.install()
+        try:
+            exec('from {} import submodule'.format(package), {})
+        finally:
+            profiler.uninstall()
+
+        assert package in profiler.import_times
+        assert package + '.submodule' in profiler.import_times
+
+    def test_from_import_missing_name(self, package):
+        """Names that aren't submodules still fail like a normal import,
+         without being timed"""
+        profiler = BootProfiler()
+        profiler.install()
+        try:
+            with pytest.raises(ImportError):
+                exec('from {} import missing'.format(package), {})
+        finally:
+            profiler.uninstall()
+
+        assert package + '.missing' not in profiler.import_times
+
+    def test_create_names_devices(self):
+        """Devices are named by their ports, and other arguments by
+         their types"""
+        profiler = BootProfiler()
+        device = profiler.create(DeviceStub)
+        profiler.create(lambda *args: DeviceStub(), 1, 'spi', 0.5,
+                        DeviceStub())
+
+        assert isinstance(device, DeviceStub)
+        assert list(profiler.device_times) == [
+            'DeviceStub()', "<lambda>(1, 'spi', 0.5, DeviceStub)"]
+
+    def test_uninstall_restores_imports(self):
+        """Uninstalling restores the import functions, and installing
+         twice doesn't hook them twice"""
+        original_import = builtins.__import__
+        original_import_module = importlib.import_module
+        profiler = BootProfiler()
+        profiler.install()
+        try:
+            hooked_import = builtins.__import__
+            assert hooked_import != original_import
+            profiler.install()
+            assert builtins.__import__ == hooked_import
+        finally:
+            profiler.uninstall()
+
+        assert builtins.__import__ == original_import
+        assert importlib.import_module == original_import_module
+        profiler.uninstall()
+        assert builtins.__import__ == original_import
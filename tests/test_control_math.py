@@ -0,0 +1,253 @@
+"""Accuracy regression tests for the control math and its fast paths
+
+Random profiles are checked against invariants of the reference
+ `MotionProfile.position()`, and optimized paths (vectorized sampling,
+ precomputed tables) are checked against the reference within a
+ tolerance. Set the `CONTROL_MATH_SAMPLES` environment variable to scale
+ the number of random cases, e.g. to 1000000 before accepting a faster
+ implementation.
+"""
+
+import math
+import os
+import random
+
+import pytest
+
+from common.drivetrain_model import DrivetrainModel
+from common.gain_schedule import GainSchedule, PhaseGains
+from common.motion_profiles import MotionProfile
+from common.pid import PIDCoefficients, PIDController
+from common.profile_optimizer import (ProfileTable, best_profile,
+                                      forward_candidates, rotate_candidates)
+
+SAMPLES = int(os.environ.get('CONTROL_MATH_SAMPLES', 20000))
+# Times sampled per profile
+TIMES_PER_PROFILE = 50
+PROFILE_COUNT = max(1, SAMPLES // TIMES_PER_PROFILE)
+TOLERANCE = 1e-9
+
+
+def random_profile_arguments(rng):
+    """Arguments for a random profile, covering tiny and huge moves and
+     both triangular and trapezoidal shapes"""
+    return (10 ** rng.uniform(-2, 1), 10 ** rng.uniform(-2, 1),
+            10 ** rng.uniform(-2, 1),
+            rng.choice([-1, 1]) * 10 ** rng.uniform(-3, 2))
+
+
+def random_profiles(seed):
+    rng = random.Random(seed)
+    for _ in range(PROFILE_COUNT):
+        arguments = random_profile_arguments(rng)
+        yield arguments, MotionProfile(*arguments), rng
+
+
+def sample_times(profile, rng):
+    """Sorted random times, including before the start and after the end"""
+    times = [rng.uniform(-0.1, 1.1) * profile.end_time
+             for _ in range(TIMES_PER_PROFILE)]
+    return sorted(times + [0.0, profile.acceleration_end_time,
+                           profile.deceleration_start_time, profile.end_time])
+
+
+def scale(value):
+    return max(1.0, abs(value))
+
+
+class TestMotionProfileInvariants:
+    """Invariants of the reference MotionProfile, over random profiles"""
+
+    def test_phase_times_ordered(self):
+        for _, profile, _ in random_profiles(1):
+            assert 0 < profile.acceleration_end_time
+            assert (profile.acceleration_end_time <=
+                    profile.deceleration_start_time + TOLERANCE)
+            assert profile.deceleration_start_time < profile.end_time
+
+    def test_reaches_target_at_end_time(self):
+        for arguments, profile, _ in random_profiles(2):
+            target = arguments[3]
+            for time in [profile.end_time, profile.end_time * 1.5]:
+                assert profile.position(time) == pytest.approx(
+                    target, rel=TOLERANCE, abs=TOLERANCE)
+            assert profile.position(0) == 0
+            assert profile.position(-1) == 0
+
+    def test_monotonic_and_continuous(self):
+        for arguments, profile, rng in random_profiles(3):
+            max_speed = arguments[2]
+            direction = -1 if profile.reverse else 1
+            times = sample_times(profile, rng)
+            positions = [direction * profile.position(time)
+                         for time in times]
+            for (time, position), (next_time, next_position) in zip(
+                    zip(times, positions), zip(times[1:], positions[1:])):
+                step = next_position - position
+                # Never moves backwards, and never faster than max speed
+                assert step >= -TOLERANCE * scale(position)
+                assert step <= (max_speed * (next_time - time) +
+                                TOLERANCE * scale(position))
+
+    def test_never_exceeds_max_speed(self):
+        for arguments, profile, _ in random_profiles(4):
+            assert profile.max_speed <= arguments[2] * (1 + TOLERANCE)
+
+    def test_reverse_mirrors_forward(self):
+        for arguments, profile, rng in random_profiles(5):
+            mirrored = MotionProfile(*arguments[:3], -arguments[3])
+            assert profile.reverse != mirrored.reverse
+            for time in sample_times(profile, rng):
+                assert profile.position(time) == -mirrored.position(time)
+
+
+class TestFastPaths:
+    """Optimized evaluation paths against the reference implementations"""
+
+    def test_vectorized_sampling_matches_position(self):
+        numpy = pytest.importorskip('numpy')
+        from common.render_motion_profiles import sample_profile
+
+        for _, profile, rng in random_profiles(6):
+            times = sample_times(profile, rng)
+            positions, velocities = sample_profile(profile,
+                                                   numpy.array(times))
+            reference = [profile.position(time) for time in times]
+            assert positions.tolist() == pytest.approx(
+                reference, rel=TOLERANCE, abs=TOLERANCE)
+            assert numpy.all(numpy.abs(velocities) <=
+                             profile.max_speed * (1 + TOLERANCE))
+
+    def test_profile_table_matches_optimizer(self):
+        model = DrivetrainModel()
+        rng = random.Random(7)
+        for candidates, max_distance, resolution in [
+                (forward_candidates(model), 10.0, 0.05),
+                (rotate_candidates(model), 4 * math.pi, math.pi / 360)]:
+            table = ProfileTable.build(candidates, max_distance,
+                                       resolution)
+            for _ in range(min(PROFILE_COUNT, 2000)):
+                distance = rng.uniform(-max_distance, max_distance)
+                looked_up = table.lookup(distance)
+                entry_distance = max(
+                    math.ceil(abs(distance) / resolution), 1) * resolution
+                assert looked_up == pytest.approx(
+                    best_profile(candidates, entry_distance))
+
+                # The profile still reaches the target
+                profile = MotionProfile(*looked_up, distance)
+                assert profile.position(profile.end_time) == pytest.approx(
+                    distance, rel=TOLERANCE, abs=TOLERANCE)
+
+    def test_gain_schedule_matches_interpolation(self):
+        rng = random.Random(8)
+
+        def random_gains():
+            return PhaseGains(*(PIDCoefficients(
+                rng.random(), rng.random(), rng.random()) for _ in range(3)))
+
+        breakpoints = sorted((rng.uniform(0, 10), random_gains())
+                             for _ in range(4))
+        resolution = 0.01
+        schedule = GainSchedule(breakpoints, 10, resolution)
+        for _ in range(min(SAMPLES, 20000)):
+            magnitude = rng.uniform(0, 12)
+            rounded = min(round(magnitude / resolution) * resolution, 10)
+            expected = GainSchedule._interpolate(breakpoints, rounded)
+            for phase, expected_phase in zip(schedule.lookup(magnitude),
+                                             expected):
+                assert phase == pytest.approx(expected_phase)
+
+
+def step_response(timer, controller, plant, dt, steps, setpoint=1.0):
+    """Run `controller` on `plant(position, output, dt)` from rest,
+     advancing the fake `timer` by `dt` each step"""
+    position = 0.0
+    positions = []
+    for _ in range(steps):
+        timer.time += dt
+        output = controller.get_output(position, setpoint)
+        position = plant(position, output, dt)
+        positions.append(position)
+    return positions
+
+
+def integrator(position, output, dt):
+    return position + output * dt
+
+
+class TestPIDStepResponse:
+    """Step responses of PIDController against closed form solutions"""
+
+    def test_proportional_matches_closed_form(self, fake_timer):
+        rng = random.Random(9)
+        for _ in range(min(PROFILE_COUNT, 200)):
+            p = rng.uniform(0.1, 10)
+            dt = rng.uniform(0.001, 0.05)
+            controller = PIDController(PIDCoefficients(p, 0, 0), 1e9, -1e9)
+            positions = step_response(fake_timer, controller, integrator,
+                                      dt, 100)
+            for step, position in enumerate(positions):
+                expected = 1 - (1 - p * dt) ** (step + 1)
+                assert position == pytest.approx(expected, rel=1e-9,
+                                                 abs=1e-12)
+
+    def test_output_clamped(self, fake_timer):
+        rng = random.Random(10)
+        for _ in range(min(PROFILE_COUNT, 200)):
+            coefs = PIDCoefficients(rng.uniform(0, 20), rng.uniform(0, 20),
+                                    rng.uniform(0, 2))
+            controller = PIDController(coefs, 1.0, -1.0)
+            position = 0.0
+            for _ in range(100):
+                fake_timer.time += 0.02
+                output = controller.get_output(position, rng.uniform(-5, 5))
+                assert -1.0 <= output <= 1.0
+                position = integrator(position, output, 0.02)
+
+    def test_integral_removes_steady_state_error(self, fake_timer):
+        def leaky_plant(position, output, dt):
+            # Needs a constant output to hold position
+            return position + (output - 0.2 * position) * dt
+
+        controller = PIDController(PIDCoefficients(2.0, 1.0, 0.0), 1.0, -1.0)
+        positions = step_response(fake_timer, controller, leaky_plant,
+                                  0.02, 2000)
+        assert positions[-1] == pytest.approx(1.0, abs=1e-3)
+
+    def test_derivative_damps(self, fake_timer):
+        controller = PIDController(PIDCoefficients(0.0, 0.0, 1.0), 1e9, -1e9)
+        fake_timer.time = 0.02
+        controller.get_output(0.0, 1.0)
+        fake_timer.time = 0.04
+        # Moving towards the setpoint at 5 units per second
+        assert controller.get_output(0.1, 1.0) == pytest.approx(-5.0)
+
+    def test_set_coefs_steps_only_proportional_and_derivative(
+            self, fake_timer):
+        # The integral accumulated so far carries over, only the newest
+        #  increment uses the new integral coefficient
+        old = PIDCoefficients(1.5, 0.6, 0.1)
+        new = PIDCoefficients(2.0, 0.3, 0.25)
+        rng = random.Random(11)
+        for _ in range(min(PROFILE_COUNT, 200)):
+            plain = PIDController(old, 1e9, -1e9)
+            switched = PIDController(old, 1e9, -1e9)
+            fake_timer.time = 0.0
+            position = 0.0
+            for _ in range(rng.randint(1, 100)):
+                fake_timer.time += 0.02
+                position = rng.uniform(-1, 1)
+                assert (switched.get_output(position, 1.0) ==
+                        plain.get_output(position, 1.0))
+
+            switched.set_coefs(new)
+            fake_timer.time += 0.02
+            previous, position = position, rng.uniform(-1, 1)
+            error = 1.0 - position
+            derivative = (position - previous) / 0.02
+            step = ((new.p - old.p) * error -
+                    (new.d - old.d) * derivative +
+                    (new.i - old.i) * error * 0.02)
+            assert (switched.get_output(position, 1.0) -
+                    plain.get_output(position, 1.0)) == pytest.approx(step)
@@ -0,0 +1,58 @@
+"""Test module for gain_schedule.py"""
+
+import pytest
+
+from common.gain_schedule import GainSchedule, PhaseGains
+from common.motion_profiles import MotionProfile, Phase
+from common.pid import PIDCoefficients
+
+
+def uniform_gains(value):
+    coefs = PIDCoefficients(p=value, i=value, d=value)
+    return PhaseGains(coefs, coefs, coefs)
+
+
+class TestGainSchedule:
+    """Test class for GainSchedule"""
+
+    def test_interpolates_between_breakpoints(self):
+        schedule = GainSchedule([(1, uniform_gains(1)), (3, uniform_gains(2))],
+                                max_magnitude=5, resolution=0.5)
+
+        assert schedule.lookup(2) == pytest.approx(uniform_gains(1.5))
+        assert schedule.lookup(-2.5) == pytest.approx(uniform_gains(1.75))
+
+    def test_clamps_outside_breakpoints(self):
+        schedule = GainSchedule([(3, uniform_gains(2)), (1, uniform_gains(1))],
+                                max_magnitude=5, resolution=0.5)
+
+        assert schedule.lookup(0) == uniform_gains(1)
+        assert schedule.lookup(4) == uniform_gains(2)
+        assert schedule.lookup(100) == uniform_gains(2)
+
+    def test_phase_gains_indexed_by_phase(self):
+        gains = PhaseGains(*(PIDCoefficients(p, 0, 0) for p in range(3)))
+
+        assert gains[Phase.acceleration.value] == gains.acceleration
+        assert gains[Phase.cruise.value] == gains.cruise
+        assert gains[Phase.deceleration.value] == gains.deceleration
+
+    def test_profile_phases(self):
+        # Accelerates for 3s, cruises for 1.5s, then decelerates for 2s
+        motion_profile = MotionProfile(3, 2, 6, 24)
+        times = [0, 2.9, 3, 4.4, 4.5, 6.5, 10]
+        phases = [Phase.acceleration, Phase.acceleration, Phase.cruise,
+                  Phase.cruise, Phase.deceleration, Phase.deceleration,
+                  Phase.deceleration]
+
+        assert [motion_profile.phase(time) for time in times] == phases
+
+    def test_drivetrain_gains_are_hand_tuned(self):
+        """Every phase and move size uses the hand tuned coefficients"""
+        from components.drivetrain import (FORWARD_COEFS, FORWARD_GAINS,
+                                           ROTATE_COEFS, ROTATE_GAINS)
+
+        assert all(coefs == FORWARD_COEFS
+                   for gains in FORWARD_GAINS.entries for coefs in gains)
+        assert all(coefs == ROTATE_COEFS
+                   for gains in ROTATE_GAINS.entries for coefs in gains)
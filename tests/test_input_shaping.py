@@ -0,0 +1,126 @@
+"""Test module for input_shaping.py"""
+
+import pytest
+
+from common.input_shaping import (Deadband, ExpoCurve, InputPipeline,
+                                  LatencyMonitor, SlewRateLimiter)
+
+
+class TestDeadband:
+    """Test class for Deadband"""
+
+    def test_small_inputs_ignored(self):
+        deadband = Deadband(0.1)
+        assert deadband(0.05) == 0
+        assert deadband(-0.1) == 0
+
+    def test_output_rescaled(self):
+        deadband = Deadband(0.1)
+        assert deadband(1.0) == pytest.approx(1.0)
+        assert deadband(-1.0) == pytest.approx(-1.0)
+        assert deadband(0.55) == pytest.approx(0.5)
+
+
+class TestExpoCurve:
+    """Test class for ExpoCurve"""
+
+    def test_matches_power(self):
+        curve = ExpoCurve(2)
+        for value in [0.0, 0.1, 0.333, 0.5, 0.9, 1.0]:
+            assert curve(value) == pytest.approx(value ** 2, abs=1e-4)
+            assert curve(-value) == pytest.approx(-value ** 2, abs=1e-4)
+
+    def test_clamps_out_of_range(self):
+        curve = ExpoCurve(3)
+        assert curve(1.5) == pytest.approx(1.0)
+        assert curve(-1.5) == pytest.approx(-1.0)
+
+
+class TestSlewRateLimiter:
+    """Test class for SlewRateLimiter"""
+
+    def test_limits_rate(self, fake_clock):
+        limiter = SlewRateLimiter(rate=5.0)
+        limiter.clock = fake_clock
+
+        # The first call assumes one period has passed
+        assert limiter(1.0) == pytest.approx(0.1)
+        fake_clock.time += 0.02
+        assert limiter(1.0) == pytest.approx(0.2)
+        fake_clock.time += 1.0
+        assert limiter(1.0) == pytest.approx(1.0)
+        fake_clock.time += 0.02
+        assert limiter(-1.0) == pytest.approx(0.9)
+
+    def test_pipeline_applies_stages_in_order(self, fake_clock):
+        limiter = SlewRateLimiter(rate=100.0)
+        limiter.clock = fake_clock
+        pipeline = InputPipeline(Deadband(0.5), ExpoCurve(2), limiter)
+        assert pipeline(0.4) == 0
+        fake_clock.time += 0.02
+        assert pipeline(0.75) == pytest.approx(0.25, abs=1e-4)
+
+
+class TestLatencyMonitor:
+    """Test class for LatencyMonitor"""
+
+    def test_measures_cycle(self, fake_clock):
+        monitor = LatencyMonitor()
+        monitor.clock = fake_clock
+
+        for _ in range(3):
+            monitor.mark_input()
+            fake_clock.time += 0.001
+            monitor.mark_shaped()
+            fake_clock.time += 0.004
+            with monitor.output():
+                fake_clock.time += 0.002
+            fake_clock.time += 0.013
+
+        assert monitor.loop_period.count == 2
+        assert monitor.loop_period.average == pytest.approx(0.02)
+        assert monitor.shaping_time.last == pytest.approx(0.001)
+        assert monitor.write_time.max == pytest.approx(0.002)
+        assert monitor.latency.average == pytest.approx(0.007)
+
+    def test_latency_only_counts_first_output(self, fake_clock):
+        monitor = LatencyMonitor()
+        monitor.clock = fake_clock
+
+        # Outputs without inputs, like in autonomous
+        with monitor.output():
+            fake_clock.time += 0.001
+        assert monitor.latency.count == 0
+        assert monitor.write_time.count == 1
+
+        monitor.mark_input()
+        for _ in range(2):
+            with monitor.output():
+                fake_clock.time += 0.001
+        assert monitor.latency.count == 1
+
+    def test_reset_forgets_disabled_time(self, fake_clock):
+        """Time between cycles before and after a reset, like while
+         disabled, isn't counted"""
+        monitor = LatencyMonitor()
+        monitor.clock = fake_clock
+        for _ in range(3):
+            monitor.mark_input()
+            with monitor.output():
+                fake_clock.time += 0.005
+            fake_clock.time += 0.015
+
+        monitor.reset()
+        assert monitor.loop_period.count == 0
+        assert monitor.latency.max == 0.0
+        # Disabled for 30 seconds
+        fake_clock.time += 30.0
+        for _ in range(3):
+            monitor.mark_input()
+            with monitor.output():
+                fake_clock.time += 0.002
+            fake_clock.time += 0.018
+
+        assert monitor.loop_period.count == 2
+        assert monitor.loop_period.max == pytest.approx(0.02)
+        assert monitor.latency.max == pytest.approx(0.002)
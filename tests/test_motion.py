@@ -0,0 +1,109 @@
+"""Test module for motion.py"""
+
+from components.motion import MotionExecutor
+
+
+class CountdownJob:
+    """Job that completes after being updated `updates` times"""
+
+    def __init__(self, updates):
+        self.remaining = updates
+
+    def __call__(self):
+        self.remaining -= 1
+        return self.remaining <= 0
+
+
+class TestMotionExecutor:
+    """Test class for MotionExecutor"""
+
+    def test_jobs_run_concurrently(self):
+        executor = MotionExecutor()
+        drive = executor.submit('drivetrain', CountdownJob(3))
+        arm = executor.submit('arm', CountdownJob(1))
+
+        executor.execute()
+        assert arm.done() and arm.finished()
+        assert not drive.done()
+        assert executor.busy('drivetrain') and not executor.busy('arm')
+
+        executor.execute()
+        executor.execute()
+        assert drive.done() and drive.finished()
+        assert not executor.busy('drivetrain')
+
+    def test_submit_replaces_mechanism_job(self):
+        executor = MotionExecutor()
+        first = executor.submit('arm', CountdownJob(2))
+        second = executor.submit('arm', CountdownJob(2))
+
+        assert first.done() and first.cancelled()
+        assert not second.done()
+
+        # Cancelling the replaced future leaves the new job running
+        first.cancel()
+        assert executor.busy('arm')
+
+    def test_cancel(self):
+        executor = MotionExecutor()
+        future = executor.submit('arm', CountdownJob(2))
+        future.cancel()
+
+        assert future.done() and future.cancelled()
+        assert not future.finished()
+        assert not executor.busy('arm')
+
+    def test_disable_cancels_all_jobs(self):
+        executor = MotionExecutor()
+        futures = [executor.submit(mechanism, CountdownJob(5))
+                   for mechanism in ['drivetrain', 'arm', 'intake']]
+        executor.on_disable()
+
+        assert all(future.cancelled() for future in futures)
+        assert not executor.jobs
+
+
+class FakeTalon:
+    def setEncPosition(self, position):
+        pass
+
+    def getEncPosition(self):
+        return 0
+
+
+class TestDrivetrainProfiles:
+    """Test class for the Drivetrain's motion profiles"""
+
+    def create_drivetrain():
+        from components.drivetrain import Drivetrain
+
+        drivetrain = Drivetrain()
+        drivetrain.motion = MotionExecutor()
+        drivetrain.arm_motor = FakeTalon()
+        return drivetrain
+
+    def test_finished_profile_done(self):
+        """A profile that runs to completion is done, and cleared"""
+        drivetrain = TestDrivetrainProfiles.create_drivetrain()
+        assert not drivetrain.forward(feet=5)
+        # Complete the profile on the next update
+        drivetrain.motion.jobs['drivetrain'] = (
+            lambda: True, drivetrain.profile_future)
+        drivetrain.motion.execute()
+
+        assert drivetrain.forward(feet=5)
+        assert drivetrain.profile_future is None
+
+    def test_cancelled_profile_not_done(self):
+        """A cancelled profile is neither done nor restarted"""
+        drivetrain = TestDrivetrainProfiles.create_drivetrain()
+        assert not drivetrain.forward(feet=5)
+        drivetrain.motion.cancel('drivetrain')
+
+        assert not drivetrain.forward(feet=5)
+        assert not drivetrain.forward(feet=5)
+        assert not drivetrain.motion.busy('drivetrain')
+
+        drivetrain.reset_motion_profile()
+        assert not drivetrain.forward(feet=5)
+        assert drivetrain.motion.busy('drivetrain')
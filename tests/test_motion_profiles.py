@@ -2,7 +2,8 @@
 
 import pytest
 
-from common.motion_profiles import MotionProfile
+from common.motion_profiles import MotionProfile, ProfileExecutor
+from common.pid import PIDCoefficients
 
 
 class TestMotionProfile:
@@ -112,3 +113,58 @@ class TestMotionProfile:
             map(lambda time: motion_profile.position(time), times))
 
         assert correct_positions == pytest.approx(calculated_positions)
+
+    def test_velocity_and_acceleration(self):
+        """Test MotionProfile velocity() and acceleration_at() in every
+         phase, and before and after the profile"""
+        motion_profile = TestMotionProfile.create_test_profile(
+            2, -3, 6, 3, 4.5, 6.5, False)
+        times = [-1, 2, 4, 5, 6, 7]
+
+        assert [motion_profile.velocity(time) for time in times] == \
+            pytest.approx([0, 4, 6, 4.5, 1.5, 0])
+        assert [motion_profile.acceleration_at(time) for time in times] == \
+            pytest.approx([0, 2, 0, -3, -3, 0])
+
+        motion_profile.reverse = True
+        assert [motion_profile.velocity(time) for time in times] == \
+            pytest.approx([0, -4, -6, -4.5, -1.5, 0])
+        assert [motion_profile.acceleration_at(time) for time in times] == \
+            pytest.approx([0, -2, 0, 3, 3, 0])
+
+
+class TestProfileExecutor:
+    """Test class for ProfileExecutor"""
+
+    def create_executor(input_source, feedforward=None):
+        outputs = []
+        # Accelerates for 3s, cruises for 1.5s, then decelerates for 2s
+        executor = ProfileExecutor(
+            PIDCoefficients(p=0.1, i=0.0, d=0.0), MotionProfile(3, 2, 6, 24),
+            input_source, outputs.append, 0.01, feedforward)
+        return executor, outputs
+
+    def test_feedforward_added_to_pid_output(self, fake_timer):
+        """The feedforward for the profile's velocity and acceleration is
+         added to the PID output, and the sum is clamped"""
+        executor, outputs = TestProfileExecutor.create_executor(
+            lambda: 3.0, lambda velocity, acceleration:
+            0.1 * velocity + 0.01 * acceleration)
+        fake_timer.time = 2
+        executor.update()
+        # One unit behind the goal, at 4 units per second and accelerating
+        #  at 2 units per second squared
+        assert outputs[-1] == pytest.approx(0.1 + 0.4 + 0.02)
+
+        executor.feedforward = lambda velocity, acceleration: 2.0
+        executor.update()
+        assert outputs[-1] == 1.0
+
+    def test_complete_once_profile_ends(self, fake_timer):
+        """The profile isn't complete when the input reaches the target
+         before the profile ends"""
+        executor, _ = TestProfileExecutor.create_executor(lambda: 24.0)
+        fake_timer.time = 6
+        assert not executor.update()
+        fake_timer.time = 6.5
+        assert executor.update()
@@ -0,0 +1,160 @@
+"""Test module for physics.py
+
+pyfrc's test harness doesn't run the physics, so these drive the
+ PhysicsEngine directly, with a fake controller that moves the robot
+ the same way as pyfrc's.
+"""
+
+import copy
+import json
+import math
+import os
+
+import pytest
+
+from physics import (TALON_DUTY_CYCLE, PhysicsEngine, SpatialIndex,
+                     separated)
+
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), '..', 'sim',
+                           'config.json')
+
+
+class FakeController:
+    """The parts of pyfrc's PhysicsInterface the engine uses"""
+
+    def __init__(self, config):
+        self.config_obj = config
+        self.robot_enabled = True
+        robot = config['pyfrc']['robot']
+        self.x = robot['starting_x']
+        self.y = robot['starting_y']
+        self.angle = math.radians(robot['starting_angle'])
+
+    def add_device_gyro_channel(self, angle_key):
+        pass
+
+    def get_position(self):
+        return self.x, self.y, self.angle
+
+    def drive(self, speed, rotation_speed, tm_diff):
+        distance = speed * tm_diff
+        angle = rotation_speed * tm_diff
+        x = distance * math.cos(angle)
+        y = distance * math.sin(angle)
+        self.angle += angle
+        cos = math.cos(self.angle)
+        sin = math.sin(self.angle)
+        self.x += x * cos - y * sin
+        self.y += x * sin + y * cos
+
+
+def load_config(substeps=None):
+    with open(CONFIG_FILE) as config_file:
+        config = json.load(config_file)
+    if substeps is not None:
+        config = copy.deepcopy(config)
+        config['physics']['substeps'] = substeps
+    return config
+
+
+def create_engine(substeps=None):
+    controller = FakeController(load_config(substeps))
+    return PhysicsEngine(controller), controller
+
+
+def run(engine, left, right, seconds, hal_data=None, tm_diff=0.02):
+    """Drive each side at an output for `seconds`, and return the
+     hal_data the engine wrote encoder positions to"""
+    if hal_data is None:
+        hal_data = {'CAN': {device: {'value': 0, 'enc_position': 0.0}
+                            for device in (1, 3, 5)}}
+    # The right side's motors are inverted
+    hal_data['CAN'][1]['value'] = left * TALON_DUTY_CYCLE
+    hal_data['CAN'][3]['value'] = -right * TALON_DUTY_CYCLE
+    for step in range(int(round(seconds / tm_diff))):
+        engine.update_sim(hal_data, step * tm_diff, tm_diff)
+    return hal_data
+
+
+def square(x, y, size=1.0):
+    return [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+
+
+class TestCollisions:
+    """Test class for separated and SpatialIndex"""
+
+    def test_separated(self):
+        assert not separated(square(0, 0), square(0.5, 0.5))
+        assert not separated(square(0, 0, 3), square(1, 1))
+        assert separated(square(0, 0), square(2, 0))
+        # Bounding boxes overlap, but the diamond misses the corner
+        diamond = [(1.9, 1.2), (2.6, 1.9), (1.9, 2.6), (1.2, 1.9)]
+        assert separated(square(0, 0), diamond)
+
+    def test_spatial_index_collides(self):
+        index = SpatialIndex([square(0, 0), square(10, 10, 4)],
+                             cell_size=2.0)
+
+        assert index.collides(square(0.5, 0.5))
+        assert index.collides(square(12, 12, 0.5))
+        # Spans several cells, only touching the second polygon's
+        assert index.collides([(5, 5), (11, 11), (10.5, 11.5)])
+        assert not index.collides(square(5, 5))
+        assert not index.collides(square(20, 20))
+
+
+class TestPhysicsEngine:
+    """Test class for PhysicsEngine"""
+
+    def test_turn_in_place_encoders(self):
+        """Turning in place moves the sides' encoders in opposite
+         directions, and the robot turns clockwise without moving"""
+        engine, controller = create_engine()
+        start = controller.get_position()
+        hal_data = run(engine, 0.5, -0.5, 1.0)
+
+        left = hal_data['CAN'][1]['enc_position']
+        right = hal_data['CAN'][3]['enc_position']
+        assert left > 0 and right < 0
+        assert left == pytest.approx(-right)
+        # The Drivetrain reads the left encoder through the arm's Talon
+        assert hal_data['CAN'][5]['enc_position'] == left
+
+        x, y, angle = controller.get_position()
+        assert angle - start[2] > math.pi / 4
+        assert (x, y) == pytest.approx(start[:2], abs=1e-9)
+
+    def test_drive_into_divider(self):
+        """The robot stops dead against the divider in the middle of
+         the field"""
+        engine, controller = create_engine()
+        # Facing the divider from a few feet away
+        controller.x = 22.0
+        hal_data = None
+        while engine.collisions == 0:
+            assert controller.x < 27, 'Drove through the divider'
+            hal_data = run(engine, 1.0, 1.0, 0.02, hal_data)
+
+        assert engine.speed == 0.0
+        assert engine.rotation_speed == 0.0
+        half_length = load_config()['pyfrc']['robot']['w'] / 2
+        assert controller.x + half_length < 26.95
+
+        # Pushing against it closes the gap, without going through
+        run(engine, 1.0, 1.0, 0.5, hal_data)
+        assert engine.collisions > 1
+        assert controller.x + half_length < 26.95
+
+    def test_substeps_agree(self):
+        """More sub-steps refine the integration, without changing where
+         the robot ends up"""
+        poses = []
+        for substeps in (5, 10, 40):
+            engine, controller = create_engine(substeps)
+            run(engine, 1.0, 0.4, 1.0)
+            run(engine, -0.3, 0.6, 0.5)
+            poses.append(controller.get_position())
+
+        for pose in poses[:-1]:
+            assert pose[:2] == pytest.approx(poses[-1][:2], abs=0.01)
+            assert pose[2] == pytest.approx(poses[-1][2], abs=0.01)
@@ -0,0 +1,73 @@
+"""Test module for profile_optimizer.py"""
+
+import pytest
+
+from common.drivetrain_model import GRAVITY, DrivetrainModel
+from common import profile_tables
+from common.profile_optimizer import (ProfileParameters, ProfileTable,
+                                      best_profile, build_tables,
+                                      forward_candidates, profile_time,
+                                      rotate_candidates)
+
+
+def parameters_time(parameters, distance):
+    return profile_time(
+        parameters.max_speed / parameters.acceleration_time,
+        parameters.max_speed / parameters.deceleration_time,
+        parameters.max_speed, distance)
+
+
+class TestProfileOptimizer:
+    """Test class for the profile optimizer"""
+
+    def test_profile_time(self):
+        # Trapezoidal, 3s ramps with 1.5s at full speed
+        assert profile_time(2, 3, 6, 24) == pytest.approx(6.5)
+        # Triangular
+        assert profile_time(1.5, 1.2, 6, 15.1875) == pytest.approx(6.75)
+
+    def test_faster_than_fixed_parameters(self):
+        model = DrivetrainModel()
+        candidates = forward_candidates(model)
+        for distance in [0.1, 1, 2.5, 8]:
+            parameters = best_profile(candidates, distance)
+            assert (parameters_time(parameters, distance) <
+                    profile_time(1, 1, 1, distance))
+
+    def test_respects_model_limits(self):
+        model = DrivetrainModel()
+        for speed, acceleration, deceleration in forward_candidates(model):
+            assert speed < model.free_speed
+            assert acceleration <= model.max_acceleration(speed)
+            assert acceleration <= model.traction_coefficient * GRAVITY
+            assert deceleration <= model.max_acceleration(0.0, True)
+
+    def test_limited_by_current(self):
+        weak = DrivetrainModel(current_limit=10)
+        strong = DrivetrainModel(current_limit=40)
+        assert weak.max_acceleration(1.0) < strong.max_acceleration(1.0)
+
+    def test_limit_speed(self):
+        parameters = ProfileParameters(1, 2, 4).limit_speed(2)
+        assert parameters == pytest.approx(ProfileParameters(0.5, 1, 2))
+        parameters = ProfileParameters(1, 2, 4).limit_speed(5)
+        assert parameters == ProfileParameters(1, 2, 4)
+
+    def test_table_lookup(self):
+        candidates = rotate_candidates(DrivetrainModel())
+        table = ProfileTable.build(candidates, 10, 0.5)
+
+        assert table.lookup(3.0) == best_profile(candidates, 3.0)
+        # Rounds up to the next entry, handles negative distances
+        assert table.lookup(-2.8) == best_profile(candidates, 3.0)
+        # Clamps to the largest entry
+        assert table.lookup(50) == best_profile(candidates, 10)
+
+    def test_generated_tables_up_to_date(self):
+        # Regenerate with `python3 -m common.profile_optimizer`
+        for name, table in build_tables():
+            assert (getattr(profile_tables, name + '_RESOLUTION') ==
+                    table.resolution)
+            generated = ProfileTable(getattr(profile_tables, name),
+                                     table.resolution)
+            assert generated.entries == table.entries
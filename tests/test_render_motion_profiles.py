@@ -0,0 +1,89 @@
+"""Test module for render_motion_profiles.py"""
+
+import argparse
+
+import pytest
+
+from common.render_motion_profiles import (ProfileSpec, input_hash, main,
+                                           parse_values, read_specs,
+                                           stale_plots, summarize)
+
+
+class TestParseValues:
+    """Test class for parse_values"""
+
+    def test_values_and_ranges(self):
+        """Values and inclusive ranges can be mixed"""
+        assert parse_values('1,2.5') == [1.0, 2.5]
+        assert parse_values('-1,0:1:0.25') == pytest.approx(
+            [-1, 0, 0.25, 0.5, 0.75, 1])
+
+    @pytest.mark.parametrize('text', ['0:1:0', '0:1:-0.5', '1:0:0.5'])
+    def test_empty_ranges_rejected(self, text):
+        """Ranges with no values are errors, not empty lists"""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_values(text)
+
+    def test_usage_error(self, capsys):
+        """argparse reports bad ranges as usage errors"""
+        with pytest.raises(SystemExit):
+            main(['--distance', '0:1:0'])
+        _, err = capsys.readouterr()
+        assert 'positive step' in err
+
+
+class TestReadSpecs:
+    """Test class for read_specs"""
+
+    def test_columns_by_name(self, tmpdir):
+        """Columns are read by name, in any order, ignoring others"""
+        csv_file = tmpdir.join('profiles.csv')
+        csv_file.write('target_distance,max_speed,notes,deceleration_time,'
+                       'acceleration_time\n'
+                       '3,1,slow,1.5,2\n'
+                       '-2,4,fast,0.5,0.25\n')
+
+        assert read_specs(str(csv_file)) == [ProfileSpec(2, 1.5, 1, 3),
+                                             ProfileSpec(0.25, 0.5, 4, -2)]
+
+
+class TestSummarize:
+    """Test class for summarize"""
+
+    def test_shapes(self):
+        """Profiles that just reach max speed are trapezoidal, like
+         MotionProfile"""
+        # Ramping up and down takes 1 unit
+        assert summarize(ProfileSpec(1, 1, 1, 0.9))['shape'] == 'triangular'
+        assert summarize(ProfileSpec(1, 1, 1, 1))['shape'] == 'trapezoidal'
+        assert summarize(ProfileSpec(1, 1, 1, -1))['shape'] == 'trapezoidal'
+
+
+class TestStalePlots:
+    """Test class for stale_plots"""
+
+    def test_skips_unchanged_plots(self, tmpdir):
+        """Only plots that are missing or have changed inputs are stale"""
+        specs = [ProfileSpec(1, 1, 1, distance) for distance in (1, 2, 3)]
+        manifest = {spec.name: input_hash(spec, 0.01, 'code')
+                    for spec in specs[:2]}
+        for spec in specs:
+            tmpdir.join(spec.name + '.png').write('')
+        # Rendered, but the plot was deleted since
+        tmpdir.join(specs[1].name + '.png').remove()
+
+        stale = stale_plots(specs, str(tmpdir), manifest, 0.01, 'code')
+        assert sorted(stale) == specs[1:]
+        assert stale[specs[2]] == (
+            str(tmpdir.join(specs[2].name + '.png')),
+            input_hash(specs[2], 0.01, 'code'))
+
+    def test_changed_code_or_time_step(self, tmpdir):
+        """Every plot is stale when the code or time step changes"""
+        spec = ProfileSpec(1, 1, 1, 1)
+        tmpdir.join(spec.name + '.png').write('')
+        manifest = {spec.name: input_hash(spec, 0.01, 'code')}
+
+        assert not stale_plots([spec], str(tmpdir), manifest, 0.01, 'code')
+        assert stale_plots([spec], str(tmpdir), manifest, 0.02, 'code')
+        assert stale_plots([spec], str(tmpdir), manifest, 0.01, 'new')
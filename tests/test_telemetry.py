@@ -0,0 +1,89 @@
+"""Test module for telemetry.py"""
+
+from networktables import NetworkTables
+
+from components.telemetry import Telemetry, encoded_size
+
+
+def create_telemetry(table_name, clock):
+    telemetry = Telemetry()
+    telemetry.table = NetworkTables.getTable(table_name)
+    telemetry.clock = clock
+    return telemetry
+
+
+def run_loops(telemetry, loops, period=0.02):
+    for _ in range(loops):
+        telemetry.execute()
+        telemetry.clock.time += period
+
+
+class TestTelemetry:
+    """Test class for Telemetry"""
+
+    def test_publishes_registered_values(self, fake_clock):
+        telemetry = create_telemetry('TelemetryPublish', fake_clock)
+        telemetry.register('speed', lambda: 0.5)
+        telemetry.register('holding', lambda: True)
+
+        run_loops(telemetry, 1)
+
+        assert telemetry.table.getNumber('speed') == 0.5
+        assert telemetry.table.getBoolean('holding') is True
+
+    def test_only_changed_values_are_sent(self, fake_clock):
+        telemetry = create_telemetry('TelemetryDelta', fake_clock)
+        values = {'a': 1.0, 'b': 2.0}
+        telemetry.register('a', lambda: values['a'])
+        telemetry.register('b', lambda: values['b'], tolerance=0.5)
+
+        run_loops(telemetry, 1)
+        sent = []
+        telemetry.table.putValue = lambda key, value: sent.append(key)
+
+        values['a'] = 3.0
+        # Within tolerance, shouldn't be sent
+        values['b'] = 2.2
+        run_loops(telemetry, 10)
+
+        assert sent == ['a']
+
+    def test_updates_are_batched_per_interval(self, fake_clock):
+        telemetry = create_telemetry('TelemetryBatch', fake_clock)
+        counter = [0]
+
+        def source():
+            counter[0] += 1
+            return counter[0]
+        telemetry.register('counter', source)
+
+        # One second of loops at the minimum interval
+        run_loops(telemetry, 50)
+
+        assert counter[0] == 10
+
+    def test_bandwidth_budget(self, fake_clock):
+        telemetry = create_telemetry('TelemetryBudget', fake_clock)
+        telemetry.bandwidth = encoded_size(0.0) * 2 / telemetry.min_interval
+        for i in range(5):
+            telemetry.register('value%d' % i, lambda: 1.0)
+
+        run_loops(telemetry, 1)
+        assert len(telemetry.published) == 2
+        assert len(telemetry.pending) == 3
+
+        run_loops(telemetry, 20)
+        assert len(telemetry.published) == 5
+        assert len(telemetry.pending) == 0
+
+    def test_interval_adapts_to_loop_headroom(self, fake_clock):
+        telemetry = create_telemetry('TelemetryHeadroom', fake_clock)
+        telemetry.register('value', lambda: 1.0)
+
+        # Loop overrunning its period
+        run_loops(telemetry, 200, period=0.04)
+        assert telemetry.interval == telemetry.max_interval
+
+        # Loop back to running on time
+        run_loops(telemetry, 1000, period=0.02)
+        assert telemetry.interval == telemetry.min_interval